@@ -72,7 +72,7 @@ async def process_arxiv_paper(arxiv_id: str, render: bool = True, save_db: bool
         
         if results.get("segments"):
             segments_text = "\n".join([
-                f"• **{s['topic']}** [{s['category']}]"
+                f"• **{s['topic']}** [{s['topic_category']}]"
                 for s in results["segments"]
             ])
             console.print(Panel(Markdown(segments_text), title="Segments"))
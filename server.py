@@ -31,6 +31,13 @@ app = FastAPI(
     redoc_url="/redoc"
 )
 
+
+@app.on_event("shutdown")
+async def close_orchestrator():
+    """Close the shared LLM HTTP session on shutdown"""
+    await orchestrator.close()
+
+
 # Security
 security = HTTPBearer(auto_error=False)
 
@@ -5,6 +5,8 @@ from src.agents.orchestrator import (
     WorkflowOrchestrator,
     orchestrator,
     AgentType,
+    AnimStatus,
+    AnimationRecord,
     AgentResult,
     FetcherAgent,
     ExtractorAgent,
@@ -16,6 +18,8 @@ __all__ = [
     "WorkflowOrchestrator",
     "orchestrator",
     "AgentType",
+    "AnimStatus",
+    "AnimationRecord",
     "AgentResult",
     "FetcherAgent",
     "ExtractorAgent",
@@ -0,0 +1,68 @@
+"""
+On-disk cache for LLM-generated Manim code
+Entries are keyed by a content hash of the prompt inputs
+"""
+import asyncio
+import hashlib
+from typing import Any, Optional
+
+import orjson
+
+try:
+    from blake3 import blake3 as _hash
+except ImportError:  # blake3 is optional; blake2b is the fastest stdlib fallback
+    _hash = hashlib.blake2b
+
+from src.config import config
+
+CACHE_DIR = config.CACHE_DIR / "llm"
+CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def make_key(payload: Any) -> str:
+    """Hash a JSON-serializable payload into a cache key"""
+    canonical = orjson.dumps(payload, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return _hash(canonical).hexdigest()
+
+
+def get(key: str) -> Optional[str]:
+    """Return cached code for a key, or None on a miss"""
+    try:
+        return (CACHE_DIR / f"{key}.py").read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def put(key: str, code: str) -> None:
+    """Store generated code under a key"""
+    path = CACHE_DIR / f"{key}.py"
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        # Write-then-rename so concurrent readers never see a partial file
+        tmp_path.write_text(code, encoding="utf-8")
+        tmp_path.replace(path)
+    except OSError:
+        pass
+
+
+def drop(key: str) -> None:
+    """Forget the code stored under a key, e.g. once it has failed to render"""
+    try:
+        (CACHE_DIR / f"{key}.py").unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+async def aget(key: str) -> Optional[str]:
+    """get() on a worker thread so the event loop never blocks on disk"""
+    return await asyncio.to_thread(get, key)
+
+
+async def aput(key: str, code: str) -> None:
+    """put() on a worker thread so the event loop never blocks on disk"""
+    await asyncio.to_thread(put, key, code)
+
+
+async def adrop(key: str) -> None:
+    """drop() on a worker thread so the event loop never blocks on disk"""
+    await asyncio.to_thread(drop, key)
@@ -3,12 +3,19 @@ Agentic Workflow Orchestrator
 Implements the multi-agent flow for paper processing and animation generation
 """
 import asyncio
+import functools
+import inspect
+import os
 import time
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, field
-from enum import Enum
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Optional, Dict, Any, List, Callable, Tuple
+from dataclasses import dataclass, field, asdict
+from enum import IntEnum, StrEnum
+from types import MappingProxyType
 from datetime import datetime
 from rich.console import Console
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from src.config import config
@@ -17,14 +24,308 @@ from src.database import (
     IntroSegment, Animation, AgentLog, ProcessingStatus
 )
 from src.extraction import paper_fetcher, PaperData
-from src.llm import openrouter_client
+from src.llm import openrouter_client, FatalLLMError
 from src.animation import animation_generator, templates
+from src.agents import _llm_cache
 
 console = Console()
 
+class AnimStatus(IntEnum):
+    """Progress of a single animation (serialized by lowercased name)"""
+    PENDING = 0
+    CODE_GENERATED = 1
+    RENDERED = 2
+    RENDER_FAILED = 3
+    RENDER_EXCEPTION = 4
+    GENERATION_FAILED = 5
 
-class AgentType(Enum):
-    """Types of agents in the workflow"""
+
+@dataclass(slots=True)
+class AnimationRecord:
+    """One generated animation as it moves through the animator"""
+    type: str
+    topic: str
+    segment_index: Optional[int] = None
+    manim_code: Optional[str] = None
+    file_path: Optional[str] = None
+    status: AnimStatus = AnimStatus.PENDING
+    error: Optional[str] = None
+
+
+@dataclass(slots=True)
+class GeneratedCode:
+    """LLM-generated Manim code, shared by every animation that asked for it, and its cache entry"""
+    cache_key: str
+    code: str = ""
+    cached: bool = False  # Served from the cache rather than freshly generated
+    users: int = 1  # Animations that have yet to report how the code did
+    usable: bool = True  # No animation has failed with it so far
+
+
+# Animation status -> persisted ProcessingStatus
+_STATUS_MAP = {
+    AnimStatus.PENDING: ProcessingStatus.PENDING,
+    AnimStatus.CODE_GENERATED: ProcessingStatus.PENDING,
+    AnimStatus.RENDERED: ProcessingStatus.COMPLETED,
+    AnimStatus.RENDER_FAILED: ProcessingStatus.FAILED,
+    AnimStatus.RENDER_EXCEPTION: ProcessingStatus.FAILED,
+    AnimStatus.GENERATION_FAILED: ProcessingStatus.FAILED,
+}
+
+def _make_render_pool():
+    """
+    Create the render worker pool
+    
+    Threads are the default since each render runs Manim in its own subprocess;
+    set RENDER_EXECUTOR=process to render from separate worker processes instead.
+    """
+    workers = int(os.getenv("RENDER_WORKERS", min(4, os.cpu_count() or 1)))
+    if os.getenv("RENDER_EXECUTOR", "thread") == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="xebot-render")
+
+
+# Dedicated render workers so Manim runs never block the event loop
+_render_pool = _make_render_pool()
+
+
+async def _render_in_worker(code: str, output_name: str, quality: str):
+    """Queue a render on the render worker pool and await its result"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _render_pool,
+        functools.partial(animation_generator.render_animation, code, output_name, quality=quality)
+    )
+
+
+async def _settle_cached_code(generated: GeneratedCode, usable: bool):
+    """
+    Report how one animation did with the code
+    
+    The last animation sharing the code settles its cache entry from all of
+    their outcomes: fresh code is cached only if it worked for every one of
+    them, and cached code that failed for any of them is forgotten.
+    """
+    generated.usable = generated.usable and usable
+    generated.users -= 1
+    if generated.users:
+        return
+    if generated.usable and not generated.cached:
+        await _llm_cache.aput(generated.cache_key, generated.code)
+    elif not usable and generated.cached:
+        await _llm_cache.adrop(generated.cache_key)
+
+
+# Segment fields the code-generation prompts actually read; everything else
+# (animation_hints, ids, ...) is left out of the prompt inputs and cache keys
+_PROMPT_FIELDS = (
+    "topic", "topic_category", "key_concepts", "content",
+    "concept_summary", "visual_metaphor", "animation_description"
+)
+
+
+def _prompt_segment(segment: Dict[str, Any]) -> Dict[str, Any]:
+    """Trim a segment down to the fields used to build its LLM prompt"""
+    return {name: segment[name] for name in _PROMPT_FIELDS if name in segment}
+
+
+def _summarize_segment(segment: Dict[str, Any], _get=dict.get) -> Dict[str, Any]:
+    """Build the API summary of a segment, truncating long content"""
+    content = _get(segment, "content", "")
+    return {
+        "topic": _get(segment, "topic"),
+        "topic_category": _get(segment, "topic_category"),
+        "key_concepts": _get(segment, "key_concepts", []),
+        "content": content[:200] + "..." if len(content) > 200 else content
+    }
+
+
+# Core INSERTs bypass ORM flush/identity-map bookkeeping for rows we never reload
+_SEGMENT_INSERT = IntroSegment.__table__.insert()
+_ANIMATION_INSERT = Animation.__table__.insert()
+
+
+# Children before parents: animations reference segments through segment_id
+_RESULT_TABLES = (Animation.__table__, IntroSegment.__table__, PaperIntroduction.__table__)
+
+
+def _clear_results(session, paper_id: int):
+    """Delete a paper's stored introduction, segments and animations before re-processing it"""
+    connection = session.connection()
+    for table in _RESULT_TABLES:
+        connection.execute(table.delete().where(table.c.paper_id == paper_id))
+
+
+def _save_segments(session, paper_id: int, segments: List[Dict[str, Any]]) -> Dict[int, int]:
+    """
+    Insert all segment rows with a single Core executemany INSERT
+    
+    Returns the new row ids keyed by segment order, so animations can be
+    linked to the segment they were generated for.
+    """
+    if not segments:
+        return {}
+    connection = session.connection()
+    connection.execute(_SEGMENT_INSERT, [
+        {
+            "paper_id": paper_id,
+            "segment_order": i,
+            "content": seg.get("content", ""),
+            "topic": seg.get("topic"),
+            "topic_category": seg.get("topic_category"),
+            "key_concepts": seg.get("key_concepts", []),
+            "animation_hints": seg.get("animation_hints", {})
+        }
+        for i, seg in enumerate(segments)
+    ])
+    table = IntroSegment.__table__
+    return dict(connection.execute(
+        select(table.c.segment_order, table.c.id).where(table.c.paper_id == paper_id)
+    ).all())
+
+
+# Column defaults shared by every animation row; rows only override what differs
+_ANIMATION_ROW = MappingProxyType({
+    "paper_id": None,
+    "segment_id": None,
+    "animation_type": "segment",
+    "file_path": None,
+    "manim_code": None,
+    "status": ProcessingStatus.PENDING
+})
+
+
+def _save_animations(session, paper_id: int, animations: List[AnimationRecord],
+                     segment_ids: Dict[int, int]):
+    """Insert all animation rows with a single Core executemany INSERT"""
+    if not animations:
+        return
+    base = _ANIMATION_ROW | {"paper_id": paper_id}
+    session.connection().execute(_ANIMATION_INSERT, [
+        base | {
+            "segment_id": segment_ids.get(anim_data.segment_index),
+            "animation_type": anim_data.type,
+            "file_path": anim_data.file_path,
+            "manim_code": anim_data.manim_code,
+            "status": _STATUS_MAP[anim_data.status]
+        }
+        for anim_data in animations
+    ])
+
+
+def _persist_animation(session, paper_id: int, anim_data: AnimationRecord,
+                       segment_ids: Dict[int, int]):
+    """Insert and commit one finished animation so it is visible immediately"""
+    try:
+        _save_animations(session, paper_id, [anim_data], segment_ids)
+        session.commit()
+    except Exception as db_err:
+        console.print(f"[yellow]Warning: Could not save animation to database: {db_err}[/yellow]")
+        session.rollback()
+
+
+# Persisted ProcessingStatus -> animation status, for cached results
+_STATUS_FROM_DB = {
+    ProcessingStatus.COMPLETED: AnimStatus.RENDERED,
+    ProcessingStatus.PENDING: AnimStatus.CODE_GENERATED,
+    ProcessingStatus.FAILED: AnimStatus.RENDER_FAILED,
+}
+
+
+def _is_usable(anim_data: AnimationRecord) -> bool:
+    """Whether an animation's code cleaned up, and rendered if asked to, without falling back"""
+    return (
+        anim_data.status in (AnimStatus.RENDERED, AnimStatus.CODE_GENERATED)
+        and anim_data.error is None
+        and animation_generator.is_usable_code(anim_data.manim_code)
+    )
+
+
+def _serialize_animation(anim_data: AnimationRecord) -> Dict[str, Any]:
+    """Plain dict of an animation for the API, with its status as a string"""
+    data = asdict(anim_data)
+    data["status"] = anim_data.status.name.lower()
+    return data
+
+
+def _find_completed_paper(session, arxiv_id: str, render: bool) -> Optional[ResearchPaper]:
+    """
+    Look up a paper that was already fully processed
+    
+    Returns the record with its introduction, segments and animations loaded,
+    or None if it has to be (re)processed: not stored yet, not completed, a
+    rendered video has gone missing from disk, or videos were requested but
+    only code was generated last time.
+    """
+    paper = (
+        session.query(ResearchPaper)
+        .options(
+            selectinload(ResearchPaper.introduction),
+            selectinload(ResearchPaper.segments),
+            selectinload(ResearchPaper.animations),
+        )
+        .filter_by(arxiv_id=arxiv_id)
+        .first()
+    )
+    if not paper or paper.status != ProcessingStatus.COMPLETED or not paper.animations:
+        return None
+    
+    file_paths = [anim.file_path for anim in paper.animations if anim.file_path]
+    if render and not file_paths:
+        return None
+    if not all(os.path.exists(path) for path in file_paths):
+        return None
+    return paper
+
+
+def _segment_from_record(segment: IntroSegment) -> Dict[str, Any]:
+    """Rebuild a segmenter-style segment dict from a stored row"""
+    return {
+        "content": segment.content,
+        "topic": segment.topic,
+        "topic_category": segment.topic_category,
+        "key_concepts": segment.key_concepts or [],
+        "animation_hints": segment.animation_hints or {}
+    }
+
+
+def _animation_from_record(animation: Animation,
+                           segments_by_id: Dict[int, IntroSegment]) -> AnimationRecord:
+    """Rebuild an animator result from a stored row and the segment it animates"""
+    segment = segments_by_id.get(animation.segment_id)
+    if segment is None:
+        topic = "Full Introduction" if animation.animation_type == "full" else ""
+    else:
+        topic = segment.topic
+    return AnimationRecord(
+        type=animation.animation_type,
+        topic=topic,
+        segment_index=segment.segment_order if segment is not None else None,
+        manim_code=animation.manim_code,
+        file_path=animation.file_path,
+        status=_STATUS_FROM_DB.get(animation.status, AnimStatus.CODE_GENERATED),
+        error=animation.error_message
+    )
+
+
+async def _run_all(jobs) -> List[Any]:
+    """
+    Run jobs concurrently and return their results in order
+    
+    A FatalLLMError in any job cancels the others instead of letting them
+    keep spending on a provider that is down; it is re-raised unwrapped.
+    """
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(job) for job in jobs]
+    except ExceptionGroup as errors:
+        fatal = errors.subgroup(FatalLLMError)
+        raise (fatal or errors).exceptions[0] from errors
+    return [task.result() for task in tasks]
+
+
+class AgentType(StrEnum):
+    """Types of agents in the workflow (members are plain strings)"""
     FETCHER = "fetcher"
     EXTRACTOR = "extractor"
     SEGMENTER = "segmenter"
@@ -47,7 +348,6 @@ class BaseAgent:
     
     def __init__(self, agent_type: AgentType):
         self.agent_type = agent_type
-        self.name = agent_type.value
     
     async def execute(self, *args, **kwargs) -> AgentResult:
         """Execute the agent's task"""
@@ -61,7 +361,7 @@ class BaseAgent:
         try:
             log = AgentLog(
                 paper_id=paper_id,
-                agent_name=self.name,
+                agent_name=self.agent_type,
                 action=action,
                 input_data=input_data,
                 output_data=output_data,
@@ -218,6 +518,210 @@ class AnimatorAgent(BaseAgent):
     
     def __init__(self):
         super().__init__(AgentType.ANIMATOR)
+        # In-flight code generation requests and the code they will share, keyed by segment signature
+        self._inflight: Dict[tuple, Tuple[asyncio.Future, GeneratedCode]] = {}
+        # Bound concurrent LLM requests to respect OpenRouter rate limits
+        self._llm_semaphore = asyncio.Semaphore(int(os.getenv("LLM_CONCURRENCY", "4")))
+        # Upper bound on one code-generation call, retries included
+        self._llm_timeout = float(os.getenv("LLM_TIMEOUT", "180"))
+    
+    async def generate_code(self, segment: Dict[str, Any], use_cache: bool = True) -> GeneratedCode:
+        """
+        Generate Manim code for a segment, coalescing identical in-flight requests
+        
+        Identical segments share one GeneratedCode. Nothing is written to the
+        LLM cache here; each segment reports through _settle_cached_code once
+        it knows whether the code worked, and the last one settles the entry.
+        """
+        key = (
+            use_cache,
+            segment.get("topic"),
+            segment.get("topic_category"),
+            tuple(sorted(segment.get("key_concepts", [])))
+        )
+        pending = self._inflight.get(key)
+        if pending is not None:
+            future, generated = pending
+            # Joined before the code exists, so the owner can't settle without us
+            generated.users += 1
+            await asyncio.shield(future)
+            return generated
+        
+        prompt_segment = _prompt_segment(segment)
+        generated = GeneratedCode(_llm_cache.make_key({
+            "segment": prompt_segment,
+            "style": "explanatory",
+            "model": openrouter_client.default_model
+        }))
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = (future, generated)
+        try:
+            code = await _llm_cache.aget(generated.cache_key) if use_cache else None
+            generated.cached = code is not None
+            if not generated.cached:
+                async with self._llm_semaphore, asyncio.timeout(self._llm_timeout):
+                    code = await openrouter_client.generate_animation_code(
+                        prompt_segment,
+                        animation_style="explanatory"
+                    )
+            generated.code = code
+            future.set_result(None)
+            return generated
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved; waiters still receive it
+            raise
+        finally:
+            self._inflight.pop(key, None)
+    
+    async def generate_full_code(
+        self, title: str, segments: List[Dict[str, Any]], use_cache: bool = True
+    ) -> GeneratedCode:
+        """Generate Manim code for the combined full animation (see generate_code on caching)"""
+        # The full-animation prompt only covers the first five segments
+        prompt_segments = [_prompt_segment(s) for s in segments[:5]]
+        cache_key = _llm_cache.make_key({
+            "title": title,
+            "segments": prompt_segments,
+            "model": openrouter_client.default_model
+        })
+        code = await _llm_cache.aget(cache_key) if use_cache else None
+        if code is not None:
+            return GeneratedCode(cache_key, code, cached=True)
+        async with self._llm_semaphore, asyncio.timeout(self._llm_timeout):
+            code = await openrouter_client.generate_full_animation_code(title, prompt_segments)
+        return GeneratedCode(cache_key, code)
+    
+    async def _animate_segment(
+        self, i: int, segment: Dict[str, Any], render: bool, use_cache: bool
+    ) -> AnimationRecord:
+        """Generate code for one segment and render it as soon as the code is ready"""
+        animation_data = AnimationRecord(
+            type="segment",
+            topic=segment.get("topic", f"Segment {i+1}"),
+            segment_index=i
+        )
+        
+        try:
+            generated = await self.generate_code(segment, use_cache)
+        except FatalLLMError:
+            raise  # Provider is down; let execute() cancel the other segments
+        except Exception as gen_error:
+            console.print(f"   [yellow]⚠ Segment {i+1} code generation failed: {str(gen_error)[:100]}[/yellow]")
+            animation_data.status = AnimStatus.GENERATION_FAILED
+            animation_data.error = str(gen_error)
+            return animation_data
+        
+        code = generated.code
+        animation_data.manim_code = code
+        animation_data.status = AnimStatus.CODE_GENERATED
+        
+        # Optionally render the animation
+        if render:
+            try:
+                result = await _render_in_worker(
+                    code,
+                    f"segment_{i+1}",
+                    quality="low_quality"  # Use low quality for speed
+                )
+                animation_data.file_path = result.file_path
+                animation_data.status = AnimStatus.RENDERED if result.success else AnimStatus.RENDER_FAILED
+                if result.error_message:
+                    animation_data.error = result.error_message
+                    
+                if result.success:
+                    console.print(f"   [green]✓ Segment {i+1} rendered successfully[/green]")
+                else:
+                    console.print(f"   [yellow]⚠ Segment {i+1} render failed, continuing...[/yellow]")
+                    
+            except Exception as render_error:
+                console.print(f"   [yellow]⚠ Segment {i+1} render exception: {str(render_error)[:100]}[/yellow]")
+                animation_data.status = AnimStatus.RENDER_EXCEPTION
+                animation_data.error = str(render_error)
+        
+        await _settle_cached_code(generated, _is_usable(animation_data))
+        return animation_data
+    
+    async def _animate_full(
+        self, title: str, segments: List[Dict[str, Any]], render: bool, use_cache: bool
+    ) -> AnimationRecord:
+        """Generate and optionally render the combined full animation"""
+        full_animation = AnimationRecord(type="full", topic="Full Introduction")
+        
+        try:
+            generated = await self.generate_full_code(title, segments, use_cache)
+        except FatalLLMError:
+            raise
+        except Exception as gen_error:
+            console.print(f"   [yellow]⚠ Full animation code generation failed: {str(gen_error)[:100]}[/yellow]")
+            full_animation.status = AnimStatus.GENERATION_FAILED
+            full_animation.error = str(gen_error)
+            return full_animation
+        
+        full_code = generated.code
+        full_animation.manim_code = full_code
+        full_animation.status = AnimStatus.CODE_GENERATED
+        
+        if render:
+            try:
+                result = await _render_in_worker(
+                    full_code,
+                    "full_introduction",
+                    quality="medium_quality"
+                )
+                full_animation.file_path = result.file_path
+                full_animation.status = AnimStatus.RENDERED if result.success else AnimStatus.RENDER_FAILED
+                if result.error_message:
+                    full_animation.error = result.error_message
+                    
+                if result.success:
+                    console.print(f"   [green]✓ Full animation rendered successfully[/green]")
+                else:
+                    console.print(f"   [yellow]⚠ Full animation render failed: {result.error_message[:100] if result.error_message else 'Unknown'}[/yellow]")
+                    
+            except Exception as render_error:
+                console.print(f"   [yellow]⚠ Full animation render exception: {str(render_error)[:100]}[/yellow]")
+                full_animation.status = AnimStatus.RENDER_EXCEPTION
+                full_animation.error = str(render_error)
+        
+        await _settle_cached_code(generated, _is_usable(full_animation))
+        return full_animation
+    
+    async def _concat_full(
+        self,
+        title: str,
+        segments: List[Dict[str, Any]],
+        segment_animations: List[AnimationRecord],
+        use_cache: bool
+    ) -> AnimationRecord:
+        """Build the full animation by joining rendered segment videos, falling back to the LLM"""
+        full_animation = AnimationRecord(type="full", topic="Full Introduction")
+        
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(
+                _render_pool,
+                functools.partial(
+                    animation_generator.concat_videos,
+                    [a.file_path for a in segment_animations],
+                    "full_introduction"
+                )
+            )
+        except Exception as concat_error:
+            result = None
+            console.print(f"   [yellow]⚠ Full animation concat exception: {str(concat_error)[:100]}[/yellow]")
+        
+        if result is None or not result.success:
+            console.print("   [yellow]⚠ Could not join segment videos, generating full animation instead...[/yellow]")
+            return await self._animate_full(title, segments, render=True, use_cache=use_cache)
+        
+        full_animation.file_path = result.file_path
+        full_animation.status = AnimStatus.RENDERED
+        console.print(f"   [green]✓ Full animation assembled from segments[/green]")
+        return full_animation
     
     async def execute(
         self, 
@@ -225,127 +729,77 @@ class AnimatorAgent(BaseAgent):
         segments: List[Dict[str, Any]], 
         generate_per_segment: bool = True,
         render: bool = True,
-        session=None
+        session=None,
+        on_progress: Optional[Callable[[str, int, int], None]] = None,
+        on_result: Optional[Callable[[AnimationRecord], None]] = None,
+        use_cache: bool = True
     ) -> AgentResult:
-        """Generate animations for segments"""
+        """
+        Generate animations for segments
+        
+        Args:
+            title: Paper title (used for the full animation)
+            segments: Segments to animate
+            generate_per_segment: Whether to generate one animation per segment
+            render: Whether to render the generated code
+            session: Optional database session
+            on_progress: Callback function(detail, done, total)
+            on_result: Callback function(animation_data) for each finished animation
+            use_cache: Whether to reuse cached LLM code (False regenerates it)
+        """
         start_time = time.time()
         
         try:
             console.print(f"\n[bold blue]🎬 Animator Agent: Generating animations[/bold blue]")
             
-            animations = []
-            
-            if generate_per_segment:
-                # Generate animation for each segment
-                failed_segments = []
-                for i, segment in enumerate(segments):
-                    console.print(f"   Generating animation for segment {i+1}/{len(segments)}...")
-                    
-                    animation_data = {
-                        "segment_index": i,
-                        "topic": segment.get("topic", f"Segment {i+1}"),
-                        "manim_code": None,
-                        "file_path": None,
-                        "status": "pending",
-                        "error": None
-                    }
-                    
-                    try:
-                        # Generate code using LLM
-                        code = await openrouter_client.generate_animation_code(
-                            segment,
-                            animation_style="explanatory"
-                        )
-                        animation_data["manim_code"] = code
-                        animation_data["status"] = "code_generated"
-                        
-                        # Optionally render the animation
-                        if render:
-                            try:
-                                result = animation_generator.render_animation(
-                                    code,
-                                    f"segment_{i+1}",
-                                    quality="low_quality"  # Use low quality for speed
-                                )
-                                animation_data["file_path"] = result.file_path
-                                animation_data["status"] = "rendered" if result.success else "render_failed"
-                                if result.error_message:
-                                    animation_data["error"] = result.error_message
-                                    
-                                if result.success:
-                                    console.print(f"   [green]✓ Segment {i+1} rendered successfully[/green]")
-                                else:
-                                    console.print(f"   [yellow]⚠ Segment {i+1} render failed, continuing...[/yellow]")
-                                    failed_segments.append(i+1)
-                                    
-                            except Exception as render_error:
-                                console.print(f"   [yellow]⚠ Segment {i+1} render exception: {str(render_error)[:100]}[/yellow]")
-                                animation_data["status"] = "render_exception"
-                                animation_data["error"] = str(render_error)
-                                failed_segments.append(i+1)
-                                # Continue to next segment instead of failing entire process
-                                
-                    except Exception as gen_error:
-                        console.print(f"   [yellow]⚠ Segment {i+1} code generation failed: {str(gen_error)[:100]}[/yellow]")
-                        animation_data["status"] = "generation_failed"
-                        animation_data["error"] = str(gen_error)
-                        failed_segments.append(i+1)
-                        # Continue to next segment instead of failing entire process
-                    
-                    animations.append(animation_data)
-                
-                # Report on failed segments
-                if failed_segments:
-                    console.print(f"   [yellow]Note: {len(failed_segments)} segment(s) had issues: {failed_segments}[/yellow]")
-            
-            # Also generate a combined full animation
-            console.print("   Generating full combined animation...")
-            
-            full_animation = {
-                "type": "full",
-                "manim_code": None,
-                "file_path": None,
-                "status": "pending",
-                "error": None
-            }
-            
-            try:
-                full_code = await openrouter_client.generate_full_animation_code(title, segments)
-                full_animation["manim_code"] = full_code
-                full_animation["status"] = "code_generated"
-                
-                if render:
-                    try:
-                        result = animation_generator.render_animation(
-                            full_code,
-                            "full_introduction",
-                            quality="medium_quality"
-                        )
-                        full_animation["file_path"] = result.file_path
-                        full_animation["status"] = "rendered" if result.success else "render_failed"
-                        if result.error_message:
-                            full_animation["error"] = result.error_message
-                            
-                        if result.success:
-                            console.print(f"   [green]✓ Full animation rendered successfully[/green]")
-                        else:
-                            console.print(f"   [yellow]⚠ Full animation render failed: {result.error_message[:100] if result.error_message else 'Unknown'}[/yellow]")
-                            
-                    except Exception as render_error:
-                        console.print(f"   [yellow]⚠ Full animation render exception: {str(render_error)[:100]}[/yellow]")
-                        full_animation["status"] = "render_exception"
-                        full_animation["error"] = str(render_error)
-                        
-            except Exception as gen_error:
-                console.print(f"   [yellow]⚠ Full animation code generation failed: {str(gen_error)[:100]}[/yellow]")
-                full_animation["status"] = "generation_failed"
-                full_animation["error"] = str(gen_error)
-            
-            animations.append(full_animation)
+            # Each job generates its code (LLM, bounded by the semaphore) and then
+            # renders on the worker pool, so rendering of finished segments
+            # overlaps with code generation for the rest
+            jobs = [self._animate_segment(i, s, render, use_cache) for i, s in enumerate(segments)] if generate_per_segment else []
+            total = len(jobs) + 1
+            # Progress labels are built once up front rather than per update
+            labels = [
+                f"segment {i+1}/{len(segments)}: {(s.get('topic', 'Unknown') or 'Unknown')[:30]}"
+                for i, s in enumerate(segments)
+            ] if generate_per_segment else []
+            full_label = "full combined animation"
+            finished = 0
+            
+            async def track(job, label: str):
+                nonlocal finished
+                animation_data = await job
+                finished += 1
+                if on_result:
+                    on_result(animation_data)
+                if on_progress:
+                    on_progress(f"Finished {label} ({finished}/{total})", finished, total)
+                return animation_data
+            
+            console.print(f"   Generating {total} animation(s)...")
+            if jobs and render:
+                animations = await _run_all(map(track, jobs, labels))
+                # When every segment rendered, the full animation is just their
+                # concatenation, which saves an LLM call and a medium-quality render
+                if all(a.status == AnimStatus.RENDERED for a in animations):
+                    animations.append(await track(self._concat_full(title, segments, animations, use_cache), full_label))
+                else:
+                    animations.append(await track(self._animate_full(title, segments, render, use_cache), full_label))
+            else:
+                jobs.append(self._animate_full(title, segments, render, use_cache))
+                labels.append(full_label)
+                animations = await _run_all(map(track, jobs, labels))
+            
+            # Report on failed segments
+            failed_segments = [
+                a.segment_index + 1 for a in animations
+                if a.type == "segment" and a.status not in (AnimStatus.RENDERED, AnimStatus.CODE_GENERATED)
+            ]
+            if failed_segments:
+                console.print(f"   [yellow]Note: {len(failed_segments)} segment(s) had issues: {failed_segments}[/yellow]")
             
             execution_time = int((time.time() - start_time) * 1000)
             
-            successful = sum(1 for a in animations if a.get("status") in ["rendered", "code_generated"])
+            successful = sum(1 for a in animations if a.status in (AnimStatus.RENDERED, AnimStatus.CODE_GENERATED))
             
             result_data = {
                 "animations": animations,
@@ -397,7 +851,8 @@ class WorkflowOrchestrator:
         self,
         arxiv_id: str,
         render_animations: bool = True,
-        save_to_db: bool = True
+        save_to_db: bool = True,
+        reprocess: bool = False
     ) -> Dict[str, Any]:
         """
         Full pipeline to process a paper and generate animations
@@ -406,6 +861,7 @@ class WorkflowOrchestrator:
             arxiv_id: arXiv paper ID
             render_animations: Whether to render animations (or just generate code)
             save_to_db: Whether to save results to database
+            reprocess: Run the pipeline even if the paper was already completed
         
         Returns:
             Complete processing results
@@ -424,17 +880,47 @@ class WorkflowOrchestrator:
         
         session = None
         paper_record = None
+        segment_ids: Dict[int, int] = {}
+        
+        # Stage 1: Fetch Paper (network I/O overlaps with DB connection setup)
+        console.print("\n[bold]Stage 1/4: Fetching Paper[/bold]")
+        fetch_task = asyncio.create_task(self.fetcher.execute(arxiv_id))
         
         if save_to_db and self.db_available:
             try:
-                session = db_manager.get_session()
+                session = await asyncio.to_thread(db_manager.get_session)
             except:
                 session = None
         
         try:
-            # Stage 1: Fetch Paper
-            console.print("\n[bold]Stage 1/4: Fetching Paper[/bold]")
-            fetch_result = await self.fetcher.execute(arxiv_id, session)
+            # Already processed: serve the stored results and skip the pipeline
+            existing = None
+            if session and not reprocess:
+                existing = _find_completed_paper(session, arxiv_id, render_animations)
+            if existing:
+                fetch_task.cancel()
+                console.print(f"[green]✓ Paper already processed, using stored results[/green]")
+                results["paper"] = {
+                    "title": existing.title,
+                    "authors": existing.authors,
+                    "abstract": (existing.abstract or "")[:500]
+                }
+                if existing.introduction:
+                    results["introduction_preview"] = existing.introduction.content[:500] + "..."
+                results["segments"] = [
+                    _summarize_segment(_segment_from_record(s))
+                    for s in sorted(existing.segments, key=lambda s: s.segment_order)
+                ]
+                segments_by_id = {s.id: s for s in existing.segments}
+                results["animations"] = [
+                    _serialize_animation(_animation_from_record(a, segments_by_id))
+                    for a in sorted(existing.animations, key=lambda a: a.id)
+                ]
+                results["cached"] = True
+                results["status"] = "completed"
+                return results
+            
+            fetch_result = await fetch_task
             results["stages"]["fetch"] = {
                 "success": fetch_result.success,
                 "time_ms": fetch_result.execution_time_ms
@@ -460,6 +946,8 @@ class WorkflowOrchestrator:
                     # Update existing paper
                     paper_record = existing_paper
                     paper_record.status = ProcessingStatus.EXTRACTING
+                    # Drop the previous run's rows so results don't accumulate
+                    _clear_results(session, paper_record.id)
                     console.print(f"[yellow]Paper already exists, re-processing...[/yellow]")
                 else:
                     # Create new paper record
@@ -521,28 +1009,11 @@ class WorkflowOrchestrator:
                 return results
             
             segments = segment_result.data["segments"]
-            results["segments"] = [
-                {
-                    "topic": s.get("topic"),
-                    "category": s.get("topic_category"),
-                    "concepts": s.get("key_concepts", [])
-                }
-                for s in segments
-            ]
+            results["segments"] = list(map(_summarize_segment, segments))
             
             # Save segments to database
             if session and paper_record:
-                for i, seg in enumerate(segments):
-                    seg_record = IntroSegment(
-                        paper_id=paper_record.id,
-                        segment_order=i,
-                        content=seg.get("content", ""),
-                        topic=seg.get("topic"),
-                        topic_category=seg.get("topic_category"),
-                        key_concepts=seg.get("key_concepts", []),
-                        animation_hints=seg.get("animation_hints", {})
-                    )
-                    session.add(seg_record)
+                segment_ids = _save_segments(session, paper_record.id, segments)
                 paper_record.status = ProcessingStatus.ANIMATING
                 session.commit()
             
@@ -553,7 +1024,8 @@ class WorkflowOrchestrator:
                 segments=segments,
                 generate_per_segment=True,
                 render=render_animations,
-                session=session
+                session=session,
+                use_cache=not reprocess
             )
             results["stages"]["animate"] = {
                 "success": animation_result.success,
@@ -561,25 +1033,23 @@ class WorkflowOrchestrator:
             }
             
             if animation_result.success:
-                results["animations"] = animation_result.data["animations"]
+                results["animations"] = list(map(_serialize_animation, animation_result.data["animations"]))
                 
                 # Save animations to database
                 if session and paper_record:
+                    # SAVEPOINT so a failed animations batch doesn't discard
+                    # anything else pending in the session
+                    savepoint = session.begin_nested()
                     try:
-                        for anim_data in animation_result.data["animations"]:
-                            anim_record = Animation(
-                                paper_id=paper_record.id,
-                                animation_type=anim_data.get("type", "segment"),
-                                file_path=anim_data.get("file_path"),
-                                manim_code=anim_data.get("manim_code"),
-                                status=ProcessingStatus.COMPLETED if anim_data.get("file_path") else ProcessingStatus.PENDING
-                            )
-                            session.add(anim_record)
+                        _save_animations(
+                            session, paper_record.id, animation_result.data["animations"], segment_ids
+                        )
+                        savepoint.commit()
                         paper_record.status = ProcessingStatus.COMPLETED
-                        session.commit()
                     except Exception as db_err:
                         console.print(f"[yellow]Warning: Could not save to database: {db_err}[/yellow]")
-                        session.rollback()
+                        savepoint.rollback()
+                    session.commit()
             
             results["status"] = "completed"
             
@@ -617,7 +1087,8 @@ class WorkflowOrchestrator:
         arxiv_id: str,
         render_animations: bool = True,
         save_to_db: bool = True,
-        on_stage_change: callable = None
+        on_stage_change: callable = None,
+        reprocess: bool = False
     ) -> Dict[str, Any]:
         """
         Full pipeline with stage callbacks for real-time tracking
@@ -627,10 +1098,33 @@ class WorkflowOrchestrator:
             render_animations: Whether to render animations
             save_to_db: Whether to save to database
             on_stage_change: Callback function(stage, detail, progress)
+            reprocess: Run the pipeline even if the paper was already completed
         """
+        # Progress updates are queued and delivered by a background task so a
+        # slow callback never stalls the pipeline; queued bursts are coalesced
+        progress_queue: asyncio.Queue = asyncio.Queue()
+        
+        async def drain_progress():
+            while True:
+                items = [await progress_queue.get()]
+                while not progress_queue.empty():
+                    items.append(progress_queue.get_nowait())
+                latest = [item for item in items if item is not None]
+                if latest:
+                    try:
+                        outcome = on_stage_change(*latest[-1])
+                        if inspect.isawaitable(outcome):
+                            await outcome
+                    except Exception as e:
+                        console.print(f"[yellow]Warning: Progress callback failed: {e}[/yellow]")
+                if items[-1] is None:
+                    return
+        
         def update(stage: str, detail: str, progress: int):
             if on_stage_change:
-                on_stage_change(stage, detail, progress)
+                progress_queue.put_nowait((stage, detail, progress))
+        
+        progress_task = asyncio.create_task(drain_progress()) if on_stage_change else None
         
         console.print("\n" + "="*60)
         console.print("[bold magenta]🤖 Xe-Bot: Research Paper Animation Pipeline[/bold magenta]")
@@ -647,18 +1141,50 @@ class WorkflowOrchestrator:
         
         session = None
         paper_record = None
+        segment_ids: Dict[int, int] = {}
+        
+        # Stage 1: Fetch Paper (network I/O overlaps with DB connection setup)
+        update("fetching", f"Downloading paper {arxiv_id} from arXiv...", 5)
+        console.print("\n[bold]Stage 1/4: Fetching Paper[/bold]")
+        fetch_task = asyncio.create_task(self.fetcher.execute(arxiv_id))
         
         if save_to_db and self.db_available:
             try:
-                session = db_manager.get_session()
+                session = await asyncio.to_thread(db_manager.get_session)
             except:
                 session = None
         
         try:
-            # Stage 1: Fetch Paper
-            update("fetching", f"Downloading paper {arxiv_id} from arXiv...", 5)
-            console.print("\n[bold]Stage 1/4: Fetching Paper[/bold]")
-            fetch_result = await self.fetcher.execute(arxiv_id, session)
+            # Already processed: serve the stored results and skip the pipeline
+            existing = None
+            if session and not reprocess:
+                existing = _find_completed_paper(session, arxiv_id, render_animations)
+            if existing:
+                fetch_task.cancel()
+                console.print(f"[green]✓ Paper already processed, using stored results[/green]")
+                results["paper"] = {
+                    "title": existing.title,
+                    "authors": existing.authors,
+                    "abstract": (existing.abstract or "")[:500],
+                    "arxiv_id": arxiv_id
+                }
+                if existing.introduction:
+                    results["introduction_preview"] = existing.introduction.content[:500] + "..."
+                results["segments"] = [
+                    _summarize_segment(_segment_from_record(s))
+                    for s in sorted(existing.segments, key=lambda s: s.segment_order)
+                ]
+                segments_by_id = {s.id: s for s in existing.segments}
+                results["animations"] = [
+                    _serialize_animation(_animation_from_record(a, segments_by_id))
+                    for a in sorted(existing.animations, key=lambda a: a.id)
+                ]
+                results["cached"] = True
+                results["status"] = "completed"
+                update("completed", "Loaded previously generated animations", 100)
+                return results
+            
+            fetch_result = await fetch_task
             results["stages"]["fetch"] = {
                 "success": fetch_result.success,
                 "time_ms": fetch_result.execution_time_ms
@@ -685,6 +1211,8 @@ class WorkflowOrchestrator:
                 if existing_paper:
                     paper_record = existing_paper
                     paper_record.status = ProcessingStatus.EXTRACTING
+                    # Drop the previous run's rows so results don't accumulate
+                    _clear_results(session, paper_record.id)
                 else:
                     paper_record = ResearchPaper(
                         arxiv_id=arxiv_id,
@@ -750,30 +1278,12 @@ class WorkflowOrchestrator:
                 return results
             
             segments = segment_result.data["segments"]
-            results["segments"] = [
-                {
-                    "topic": s.get("topic"),
-                    "topic_category": s.get("topic_category"),
-                    "key_concepts": s.get("key_concepts", []),
-                    "content": s.get("content", "")[:200] + "..."
-                }
-                for s in segments
-            ]
+            results["segments"] = list(map(_summarize_segment, segments))
             update("segmenting", f"Created {len(segments)} segments", 55)
             
             # Save segments to database
             if session and paper_record:
-                for i, seg in enumerate(segments):
-                    seg_record = IntroSegment(
-                        paper_id=paper_record.id,
-                        segment_order=i,
-                        content=seg.get("content", ""),
-                        topic=seg.get("topic"),
-                        topic_category=seg.get("topic_category"),
-                        key_concepts=seg.get("key_concepts", []),
-                        animation_hints=seg.get("animation_hints", {})
-                    )
-                    session.add(seg_record)
+                segment_ids = _save_segments(session, paper_record.id, segments)
                 paper_record.status = ProcessingStatus.ANIMATING
                 session.commit()
             
@@ -781,101 +1291,38 @@ class WorkflowOrchestrator:
             update("animating", f"Generating animations for {len(segments)} segments...", 60)
             console.print("\n[bold]Stage 4/4: Generating Animations[/bold]")
             
-            # Custom animation generation with progress tracking
-            animations = []
-            total_anims = len(segments) + 1  # segments + full animation
-            
-            for i, segment in enumerate(segments):
-                anim_progress = 60 + int((i / total_anims) * 35)
-                update("animating", f"Rendering segment {i+1}/{len(segments)}: {segment.get('topic', 'Unknown')[:30]}...", anim_progress)
-                
-                animation_data = {
-                    "segment_index": i,
-                    "type": "segment",
-                    "topic": segment.get("topic", f"Segment {i+1}"),
-                    "manim_code": None,
-                    "file_path": None,
-                    "status": "pending",
-                    "error": None
-                }
-                
-                try:
-                    code = await openrouter_client.generate_animation_code(
-                        segment,
-                        animation_style="explanatory"
-                    )
-                    animation_data["manim_code"] = code
-                    animation_data["status"] = "code_generated"
-                    
-                    if render_animations:
-                        try:
-                            result = animation_generator.render_animation(
-                                code,
-                                f"segment_{i+1}",
-                                quality="low_quality"
-                            )
-                            animation_data["file_path"] = result.file_path
-                            animation_data["status"] = "rendered" if result.success else "render_failed"
-                            if result.error_message:
-                                animation_data["error"] = result.error_message
-                        except Exception as render_error:
-                            animation_data["status"] = "render_exception"
-                            animation_data["error"] = str(render_error)
-                except Exception as gen_error:
-                    animation_data["status"] = "generation_failed"
-                    animation_data["error"] = str(gen_error)
-                
-                animations.append(animation_data)
-            
-            # Generate full combined animation
-            update("animating", "Generating full combined animation...", 95)
-            full_animation = {
-                "type": "full",
-                "topic": "Full Introduction",
-                "manim_code": None,
-                "file_path": None,
-                "status": "pending",
-                "error": None
+            # Animation generation with progress tracking
+            animation_result = await self.animator.execute(
+                title=paper_data["title"],
+                segments=segments,
+                generate_per_segment=True,
+                render=render_animations,
+                session=session,
+                on_progress=lambda detail, done, total: update(
+                    "animating", detail, 60 + int((done / total) * 35)
+                ),
+                # Persist each animation as it finishes so progress is visible
+                # and one failure doesn't roll back the others
+                on_result=(
+                    (lambda anim_data: _persist_animation(session, paper_record.id, anim_data, segment_ids))
+                    if session and paper_record else None
+                ),
+                use_cache=not reprocess
+            )
+            results["stages"]["animate"] = {
+                "success": animation_result.success,
+                "time_ms": animation_result.execution_time_ms
             }
             
-            try:
-                full_code = await openrouter_client.generate_full_animation_code(paper_data["title"], segments)
-                full_animation["manim_code"] = full_code
-                full_animation["status"] = "code_generated"
-                
-                if render_animations:
-                    try:
-                        result = animation_generator.render_animation(
-                            full_code,
-                            "full_introduction",
-                            quality="medium_quality"
-                        )
-                        full_animation["file_path"] = result.file_path
-                        full_animation["status"] = "rendered" if result.success else "render_failed"
-                        if result.error_message:
-                            full_animation["error"] = result.error_message
-                    except Exception as render_error:
-                        full_animation["status"] = "render_exception"
-                        full_animation["error"] = str(render_error)
-            except Exception as gen_error:
-                full_animation["status"] = "generation_failed"
-                full_animation["error"] = str(gen_error)
-            
-            animations.append(full_animation)
-            results["animations"] = animations
-            
-            # Save animations to database
+            if not animation_result.success:
+                raise RuntimeError(f"Animate failed: {animation_result.error}")
+            
+            animations = animation_result.data["animations"]
+            results["animations"] = list(map(_serialize_animation, animations))
+            
+            # Animations were persisted as they finished; mark the paper done
             if session and paper_record:
                 try:
-                    for anim_data in animations:
-                        anim_record = Animation(
-                            paper_id=paper_record.id,
-                            animation_type=anim_data.get("type", "segment"),
-                            file_path=anim_data.get("file_path"),
-                            manim_code=anim_data.get("manim_code"),
-                            status=ProcessingStatus.COMPLETED if anim_data.get("file_path") else ProcessingStatus.PENDING
-                        )
-                        session.add(anim_record)
                     paper_record.status = ProcessingStatus.COMPLETED
                     session.commit()
                 except Exception as db_err:
@@ -906,6 +1353,10 @@ class WorkflowOrchestrator:
                     session.rollback()
         
         finally:
+            if progress_task:
+                # Flush the final update before returning
+                progress_queue.put_nowait(None)
+                await progress_task
             if session:
                 try:
                     session.close()
@@ -914,6 +1365,10 @@ class WorkflowOrchestrator:
         
         return results
     
+    async def close(self):
+        """Release shared network resources (LLM HTTP session)"""
+        await openrouter_client.aclose()
+    
     async def generate_animation_only(
         self,
         text_content: str,
@@ -953,7 +1408,7 @@ class WorkflowOrchestrator:
         return {
             "success": animation_result.success,
             "segments": segments,
-            "animations": animation_result.data.get("animations", []),
+            "animations": list(map(_serialize_animation, animation_result.data.get("animations", []))),
             "error": animation_result.error
         }
 
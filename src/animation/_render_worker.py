@@ -0,0 +1,114 @@
+"""
+Persistent Manim render worker
+Runs as a child process so manim is imported once and reused across renders.
+Reads one JSON job per line on stdin and answers each with one JSON line on
+the original stdout; everything manim prints is redirected to stderr.
+
+Standalone on purpose (stdlib + manim only): it is started by file path and
+never imports the rest of the package.
+"""
+import hashlib
+import json
+import marshal
+import os
+import sys
+import traceback
+import types
+
+# Compiled scene code by source hash; the same script is often rendered again
+# (other quality, retry after a timeout) and needn't be parsed twice
+_CODE_CACHE = {}
+_CODE_CACHE_SIZE = 64
+
+
+def _load_code(cache_file: str):
+    try:
+        with open(cache_file, "rb") as f:
+            return marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+def _store_code(cache_file: str, code) -> None:
+    # Written under a temporary name so concurrent workers never read half a file
+    tmp = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(tmp, "wb") as f:
+            marshal.dump(code, f)
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass  # The cache is only an optimization
+
+
+def _compile(source: bytes, path: str, cache_dir: str = None):
+    key = hashlib.blake2b(source, digest_size=16).digest()
+    code = _CODE_CACHE.pop(key, None)
+    if code is None:
+        # Like .pyc files, marshalled code is only valid for this interpreter
+        cache_file = cache_dir and os.path.join(
+            cache_dir, f"{key.hex()}.{sys.implementation.cache_tag}.bin"
+        )
+        code = _load_code(cache_file) if cache_file else None
+        if code is None:
+            code = compile(source, path, "exec", dont_inherit=True)
+            if cache_file:
+                _store_code(cache_file, code)
+        if len(_CODE_CACHE) >= _CODE_CACHE_SIZE:
+            del _CODE_CACHE[next(iter(_CODE_CACHE))]  # Least recently used
+    _CODE_CACHE[key] = code
+    return code
+
+
+def _render(job: dict, config, tempconfig) -> None:
+    """Render one scene with the same settings the manim CLI would use"""
+    module_name = f"xebot_scene_{job['id']}"
+    with open(job["script_path"], "rb") as f:
+        code = _compile(f.read(), job["script_path"], job.get("code_cache_dir"))
+    module = types.ModuleType(module_name)
+    module.__file__ = job["script_path"]
+    sys.modules[module_name] = module
+    try:
+        exec(code, module.__dict__)
+        scene_class = getattr(module, job["scene_name"])
+
+        # tempconfig restores the global config afterwards so jobs don't leak
+        with tempconfig({}):
+            config.quality = job["quality"]
+            config.frame_rate = job["fps"]
+            config.disable_caching = True
+            config.media_dir = job["media_dir"]
+            # Output lands in media_dir/videos/<script stem>/<quality>/, like the CLI
+            config.input_file = job["script_path"]
+            config.output_file = job["output_file"]
+            scene_class().render()
+    finally:
+        sys.modules.pop(module_name, None)
+
+
+def main():
+    # Keep the protocol stream private; manim/rich logging goes to stderr
+    protocol = os.fdopen(os.dup(1), "w", buffering=1)
+    os.dup2(2, 1)
+
+    try:
+        from manim import config, tempconfig
+    except Exception:
+        protocol.write(json.dumps({"ready": False, "error": traceback.format_exc()[-1000:]}) + "\n")
+        return
+    protocol.write(json.dumps({"ready": True}) + "\n")
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        job = json.loads(line)
+        try:
+            _render(job, config, tempconfig)
+            reply = {"ok": True}
+        except Exception:
+            reply = {"ok": False, "error": traceback.format_exc()[-2000:]}
+        protocol.write(json.dumps(reply) + "\n")
+
+
+if __name__ == "__main__":
+    main()
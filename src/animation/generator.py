@@ -3,20 +3,170 @@ Manim Animation Generator
 Core module for generating animations from research paper segments
 """
 import os
+import re
+import ast
+import atexit
+import sys
+import json
+import uuid
+import queue
+import signal
+import struct
+import functools
+import hashlib
+import threading
 import subprocess
 import tempfile
+import textwrap
 import shutil
+import string
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from types import MappingProxyType
+from typing import IO, Optional, Dict, Any, List, Tuple, Union
 from dataclasses import dataclass
-from datetime import datetime
 from rich.console import Console
 
+try:
+    from blake3 import blake3 as _hash
+except ImportError:  # blake3 is optional
+    _hash = hashlib.blake2b
+
+try:
+    import psutil
+except ImportError:  # psutil is optional; batch renders then size by CPU count only
+    psutil = None
+
 from src.config import config
+from src.animation.quantum_templates import quantum_templates
 
 console = Console()
 
+# Compiled once; the code-cleanup helpers below run on every render
+_RE_SCENE_CLASS = re.compile(r'class\s+(\w+)\s*\(\s*(?:Scene|MovingCameraScene|ThreeDScene|ZoomedScene)')
+_RE_NON_IDENTIFIER = re.compile(r'[^a-zA-Z0-9_]')
+_RE_SECTION_TITLE = re.compile(r'.*=\s*Text\(["\'](?:Segment|Section|Background|Problem|Approach|Method|Result|Conclusion)', re.IGNORECASE)
+# Lines that can start a section or play/wait (see _ensure_fadeouts_between_sections)
+_RE_SECTION_SCAN_LINE = re.compile(r'^([^\S\n]*)[^\n]*?(?:self\.play\(|self\.wait\(|FadeOut|Text\(|(?i:seg_title|segment))[^\n]*$', re.MULTILINE)
+_RE_DEF_OR_CLASS_LINE = re.compile(r'^([^\S\n]*)([^\n]*(?:def |class )[^\n]*)$', re.MULTILINE)
+_RE_MATHTEX = re.compile(r'MathTex\s*\(')
+_RE_TEX = re.compile(r'(?<!Ma)Tex\s*\(')
+_RE_LATEX_FRAC = re.compile(r'\\\\frac\{[^}]*\}\{[^}]*\}')
+_RE_LATEX_COMMAND = re.compile(r'\\\\[a-zA-Z]+\{[^}]*\}')
+_RE_INLINE_MATH = re.compile(r'\$[^$]+\$')
+_RE_ZERO_RUN_TIME = re.compile(r'run_time\s*=\s*0([,\)])')
+_RE_NEGATIVE_RUN_TIME = re.compile(r'run_time\s*=\s*-')
+_RE_ASSIGN_WHITE = re.compile(r'\bWHITE\s*=')
+_RE_ASSIGN_BLUE = re.compile(r'\bBLUE\s*=')
+_RE_ASSIGN_RED = re.compile(r'\bRED\s*=')
+_RE_DOUBLE_SCENE_BASE = re.compile(r'class\s+(\w+)\s*\(\s*Scene\s*,\s*Scene\s*\)')
+_RE_LONG_TEXT = re.compile(r'Text\(["\']([^"\']{61,})["\']')
+_RE_DIVIDE_BY_ZERO = re.compile(r'/\s*0([^\d.])')
+_RE_EMPTY_LAGGED_START = re.compile(r'LaggedStart\(\*\[\s*\]')
+_RE_NP_ARRAY = re.compile(r'np\.array\(\[([^\]]*)\]\s*\)')
+_RE_PRINT_LINE = re.compile(r'^\s*print\(.*\)\s*$', re.MULTILINE)
+
+
+# Constant-replacement fixes that can't overlap, fused into one alternation so
+# the code is scanned once; each pattern is its own group (no inner groups)
+_SIMPLE_FIXES = (
+    (r'self\.play\(\*\[\s*\]\)', '# Empty animation removed'),
+    (r'self\.play\(\*\[FadeOut\(m\) for m in \[\]\]\)', '# Empty FadeOut removed'),
+    (r'self\.play\(\*\[FadeIn\(m\) for m in \[\]\]\)', '# Empty FadeIn removed'),
+    (r'\.scale\(0\)', '.scale(0.01)'),
+    (r'Fadeout|fadeout', 'FadeOut'),
+    (r'Fadein|fadein', 'FadeIn'),
+    (r'Flash\(\s*\)', 'Flash(ORIGIN)'),
+    (r'GREY', 'GRAY'),  # Also covers GREY_A..GREY_E
+    (r'self\.wait\(\s*0\s*\)', 'self.wait(0.1)'),
+    (r'self\.wait\(\s*-', 'self.wait(0.5'),
+    (r'Text\(\s*(?:""|\'\')?\s*\)', 'Text(" ")'),
+    (r'VGroup\(\s*None\s*\)', 'VGroup()'),
+)
+_RE_SIMPLE_FIXES = re.compile('|'.join(f'({pattern})' for pattern, _ in _SIMPLE_FIXES))
+_SIMPLE_FIX_REPLACEMENTS = (None,) + tuple(replacement for _, replacement in _SIMPLE_FIXES)
+
+
+# Swapped in by _ensure_valid_manim_code for code that doesn't parse
+_SYNTAX_ERROR_SCENE = '''from manim import *
+
+class GeneratedScene(Scene):
+    def construct(self):
+        title = Text("Animation Generation Error", font_size=36, color=RED)
+        subtitle = Text("Using fallback animation", font_size=24)
+        subtitle.next_to(title, DOWN)
+        self.play(Write(title), FadeIn(subtitle))
+        self.wait(2)
+        self.play(FadeOut(title), FadeOut(subtitle))
+        
+        # Branding
+        branding = Text("Animation by Xe-Bot", font_size=36, color=BLUE)
+        self.play(FadeIn(branding))
+        self.wait(2)
+        self.play(FadeOut(branding))
+'''
+
+# Something for the cleanup passes in _ensure_valid_manim_code to rewrite;
+# literal substrings first, then the patterns that allow whitespace
+_CLEANUP_TRIGGERS = (
+    'MathTex', '\\\\', '$', 'for m in []', 'for m in self.mobjects])', '.scale(0)',
+    'Fadeout', 'Fadein', 'fadeout', 'fadein', 'GREY', 'Arrow3D',
+)
+_RE_CLEANUP_TRIGGER = re.compile(
+    r'Tex\s*\(|self\.play\(\*\[\s*\]|run_time\s*=\s*(?:0[,\)]|-)|\b(?:WHITE|BLUE|RED)\s*='
+    r'|Scene\s*,\s*Scene\s*\)|Text\(["\'][^"\']{61}|/\s*0[^\d.]|LaggedStart\(\*\[\s*\]'
+    r'|Flash\(\s*\)|np\.array\(\[[^\]]*\]\s+\)|^\s*print\(.*\)\s*$'
+    r'|self\.wait\(\s*(?:0\s*\)|-)|Text\(\s*(?:""|\'\')?\s*\)|VGroup\(\s*None\s*\)',
+    re.MULTILINE,
+)
+
+
+# Unicode that trips up generated code, mapped to ASCII stand-ins
+_UNICODE_FIXES = str.maketrans({
+    '•': '-', '→': '->', '←': '<-',
+    '≈': '~', '≠': '!=', '≤': '<=', '≥': '>=',
+    '…': '...',  # Ellipsis
+    '–': '-', '—': '-',  # Dashes
+    'α': 'alpha', 'β': 'beta', 'γ': 'gamma',
+    'Δ': 'Delta', 'δ': 'delta',
+    'π': 'pi', 'σ': 'sigma', 'μ': 'mu',
+    '∞': 'infinity', '∑': 'sum',
+})
+
+
+def _mp4_duration(video_path: Path) -> Optional[float]:
+    """Read the duration from an MP4's moov/mvhd header, or None if it can't be found"""
+    with open(video_path, 'rb') as f:
+        end = os.fstat(f.fileno()).st_size
+        pos = 0
+        while pos + 8 <= end:
+            f.seek(pos)
+            size, box_type = struct.unpack('>I4s', f.read(8))
+            header = 8
+            if size == 1:  # 64-bit size follows the type
+                size, = struct.unpack('>Q', f.read(8))
+                header = 16
+            elif size == 0:  # Box runs to the end of its parent
+                size = end - pos
+            if size < header:
+                return None
+            if box_type == b'moov':
+                # Descend into moov; its children are searched the same way
+                pos, end = pos + header, pos + size
+                continue
+            if box_type == b'mvhd':
+                version = f.read(1)[0]
+                f.read(3)  # Flags
+                if version == 1:
+                    _, _, timescale, duration = struct.unpack('>QQIQ', f.read(28))
+                else:
+                    _, _, timescale, duration = struct.unpack('>IIII', f.read(16))
+                return duration / timescale if timescale else None
+            pos += size
+    return None
+
 
 @dataclass
 class AnimationResult:
@@ -28,6 +178,455 @@ class AnimationResult:
     duration_seconds: int = 0
 
 
+@dataclass(slots=True, frozen=True)
+class SegmentView:
+    """The segment fields the code generators read, taken out of the segment dict once"""
+    topic: str = ''
+    content: str = ''
+    topic_category: str = 'general'
+    key_concepts: Tuple[str, ...] = ()
+
+
+def _segment_view(segment: Union[Dict[str, Any], SegmentView]) -> SegmentView:
+    """View of a segment dict; views are passed through as they are"""
+    if isinstance(segment, SegmentView):
+        return segment
+    return SegmentView(
+        segment.get('topic') or '',
+        segment.get('content') or '',
+        segment.get('topic_category') or 'general',
+        tuple(segment.get('key_concepts') or ())
+    )
+
+
+_WORKER_SCRIPT = Path(__file__).with_name("_render_worker.py")
+
+# Pixel height per manim quality; output lands in <height>p<fps> directories
+_QUALITY_HEIGHTS = {
+    "low_quality": 480,
+    "medium_quality": 720,
+    "high_quality": 1080,
+    "production_quality": 1440,
+    "fourk_quality": 2160,
+}
+
+@functools.lru_cache(maxsize=256)
+def _parse(code: str) -> Tuple[Optional[ast.Module], Optional[SyntaxError]]:
+    """Parse code (no bytecode generation) into (tree, None), or (None, the SyntaxError)"""
+    try:
+        return ast.parse(code), None
+    except SyntaxError as e:
+        return None, e
+
+
+def _construct_method(tree: ast.Module) -> Optional[ast.FunctionDef]:
+    """The first construct() defined in a class, if any"""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            for item in node.body:
+                if isinstance(item, ast.FunctionDef) and item.name == 'construct':
+                    return item
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _wrap_content(content: str, width: int = 45) -> Tuple[str, ...]:
+    """Greedy word wrap of segment content; memoized, re-segmenting repeats the same prose"""
+    return tuple(textwrap.wrap(
+        ' '.join(content.split()), width=width, break_long_words=False, break_on_hyphens=False
+    ))
+
+
+# Temp directories are removed in the background so renders return sooner;
+# pending removals still finish before the interpreter exits
+_CLEANUP_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="manim-cleanup")
+atexit.register(_CLEANUP_POOL.shutdown, wait=True)
+
+
+def _remove_dir_later(path: Path):
+    """Queue a directory tree for removal on the cleanup pool"""
+    _CLEANUP_POOL.submit(shutil.rmtree, path, ignore_errors=True)
+
+
+# Lines of stderr kept from a manim CLI run for the error message
+_STDERR_TAIL_LINES = 200
+
+
+def _kill_process_tree(process: subprocess.Popen):
+    """SIGTERM a process and its session (manim's ffmpeg children), then SIGKILL"""
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except (AttributeError, OSError):  # No process groups (Windows) or already gone
+        process.terminate()
+    try:
+        process.wait(timeout=1)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+    try:
+        os.killpg(process.pid, signal.SIGKILL)  # Stragglers left in the group
+    except (AttributeError, OSError):
+        pass
+
+
+def _run_cli(cmd: List[str], timeout: float, cwd: Path) -> subprocess.CompletedProcess:
+    """
+    Run a command keeping only the tail of its stderr
+    
+    stdout (manim's progress bars) is discarded, so memory stays bounded
+    however verbose the render is. Raises TimeoutExpired after killing it.
+    """
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        cwd=cwd,
+        text=True,
+        errors='replace',
+        start_new_session=True
+    )
+    tail = deque(maxlen=_STDERR_TAIL_LINES)
+    reader = threading.Thread(target=tail.extend, args=(process.stderr,), daemon=True)
+    reader.start()
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _kill_process_tree(process)
+        raise
+    finally:
+        reader.join(timeout=5)
+        if not reader.is_alive():
+            process.stderr.close()
+    return subprocess.CompletedProcess(cmd, process.returncode, "", "".join(tail))
+
+
+class _RenderWorker:
+    """
+    A persistent manim worker process (see _render_worker.py)
+    
+    Each render thread owns one, so concurrent renders never share a worker.
+    The process is replaced after a timeout, a crash, or max_jobs renders.
+    """
+    
+    # Set once a worker fails to start (e.g. manim can't be imported in-process)
+    unavailable = False
+    
+    def __init__(self, max_jobs: int):
+        self.max_jobs = max_jobs
+        self.process: Optional[subprocess.Popen] = None
+        self.replies: Optional[queue.Queue] = None
+        self.jobs = 0
+    
+    @staticmethod
+    def _pump_replies(stdout: IO[str], replies: queue.Queue):
+        """Reader thread: queue each reply line, then None once the worker exits"""
+        try:
+            for line in stdout:
+                replies.put(line)
+        except (OSError, ValueError):
+            pass  # Pipe closed by stop()
+        replies.put(None)
+    
+    def _read_reply(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """Wait for the worker's next reply line; None if the worker exited"""
+        # A reader thread rather than select(), which doesn't take pipes on Windows
+        try:
+            line = self.replies.get(timeout=timeout)
+        except queue.Empty:
+            raise subprocess.TimeoutExpired(self.process.args, timeout)
+        return json.loads(line) if line else None
+    
+    def _start(self) -> bool:
+        try:
+            self.process = subprocess.Popen(
+                [sys.executable, str(_WORKER_SCRIPT)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
+            )
+        except OSError as e:
+            return self._unavailable(str(e))
+        self.jobs = 0
+        self.replies = queue.Queue()
+        threading.Thread(
+            target=self._pump_replies, args=(self.process.stdout, self.replies), daemon=True
+        ).start()
+        try:
+            reply = self._read_reply(timeout=60)
+        except (subprocess.TimeoutExpired, OSError, ValueError):
+            reply = None
+        if not reply or not reply.get("ready"):
+            return self._unavailable(reply.get("error", "") if reply else "no response")
+        return True
+    
+    def _unavailable(self, error: str) -> bool:
+        """Give up on workers for this run; renders fall back to the manim CLI"""
+        self.stop()
+        _RenderWorker.unavailable = True
+        console.print(f"[yellow]⚠ Render worker unavailable, using the manim CLI: {error[-200:]}[/yellow]")
+        return False
+    
+    def stop(self):
+        """Stop the worker process, escalating to SIGKILL if it won't exit"""
+        if self.process is None:
+            return
+        process, self.process = self.process, None
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        try:
+            process.terminate()
+        except OSError:
+            pass  # Already gone
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+    
+    def render(self, job: Dict[str, Any], timeout: float) -> Optional[subprocess.CompletedProcess]:
+        """Render a job; None if no worker could be started"""
+        if self.process is None or self.process.poll() is not None:
+            if not self._start():
+                return None
+        
+        args = [str(_WORKER_SCRIPT), job["script_path"], job["scene_name"]]
+        try:
+            self.process.stdin.write(json.dumps(job) + "\n")
+            self.process.stdin.flush()
+            reply = self._read_reply(timeout)
+        except subprocess.TimeoutExpired:
+            self.stop()  # Abandon the stuck render along with its process
+            raise
+        except (OSError, ValueError):
+            reply = None
+        
+        if reply is None:
+            self.stop()
+            return subprocess.CompletedProcess(args, 1, "", "Render worker exited unexpectedly")
+        
+        self.jobs += 1
+        if self.jobs >= self.max_jobs:
+            self.stop()  # Recycle to bound memory growth across scenes
+        if reply.get("ok"):
+            return subprocess.CompletedProcess(args, 0, "", "")
+        return subprocess.CompletedProcess(args, 1, "", reply.get("error") or "Unknown error")
+    
+    def __del__(self):
+        # The owning render thread has exited; don't leave its process behind
+        try:
+            self.stop()
+        except Exception:
+            pass  # Interpreter shutdown
+
+
+# Code templates for the create_*_animation helpers, parsed once at import
+_TEXT_ANIMATION_TEMPLATE = string.Template('''from manim import *
+
+class ResearchAnimation(Scene):
+    def construct(self):
+        # Title
+        title = Text($title, font_size=42, color=BLUE)
+        title.to_edge(UP)
+        self.play(Write(title))
+        self.wait(0.5)
+        
+        # Content chunks
+        chunks = $chunks
+        
+        previous_text = None
+        for i, chunk in enumerate(chunks):
+            text = Text(chunk, font_size=28)
+            text.next_to(title, DOWN, buff=1.5)
+            
+            if previous_text:
+                self.play(
+                    FadeOut(previous_text),
+                    FadeIn(text)
+                )
+            else:
+                self.play(Write(text))
+            
+            self.wait(2)
+            previous_text = text
+        
+        # Fade out
+        self.play(FadeOut(title), FadeOut(previous_text))
+        self.wait(0.5)
+''')
+
+_CONCEPT_ANIMATION_TEMPLATE = string.Template('''from manim import *
+
+class ConceptAnimation(Scene):
+    def construct(self):
+        # Title
+        title = Text($title, font_size=48, color=BLUE)
+        self.play(Write(title))
+        self.wait(1)
+        self.play(title.animate.to_edge(UP))
+        
+        # Concepts
+        concept_mobjects = [$concept_texts]
+        
+        # Arrange concepts
+        group = VGroup(*concept_mobjects)
+        group.arrange(DOWN, buff=0.5)
+        group.next_to(title, DOWN, buff=1)
+        
+        # Animate each concept
+        for i, mob in enumerate(concept_mobjects):
+            self.play(FadeIn(mob, shift=RIGHT), run_time=0.5)
+            self.wait(0.3)
+        
+        self.wait(2)
+        
+        # Highlight each concept in turn, as one scheduled animation
+        if concept_mobjects:
+            self.play(
+                AnimationGroup(
+                    *[mob.animate(rate_func=there_and_back).scale(1.2) for mob in concept_mobjects],
+                    lag_ratio=1
+                ),
+                run_time=0.5 * len(concept_mobjects)
+            )
+        
+        self.wait(1)
+        
+        # Fade out
+        self.play(FadeOut(group), FadeOut(title))
+''')
+
+_SEGMENT_ANIMATION_TEMPLATE = string.Template('''from manim import *
+
+class Segment${segment_number}Animation(Scene):
+    def construct(self):
+        # Segment header
+        header = Text($header, font_size=36, color=$main_color)
+        header.to_edge(UP)
+        
+        category_label = Text($category_label, font_size=24, color=GRAY)
+        category_label.next_to(header, DOWN)
+        
+        self.play(Write(header))
+        self.play(FadeIn(category_label))
+        self.wait(1)
+        
+        # Content summary, wrapped when the code was generated
+        lines = $lines
+        
+        content_group = VGroup()
+        for line in lines:
+            text = Text(line, font_size=24)
+            content_group.add(text)
+        
+        content_group.arrange(DOWN, aligned_edge=LEFT, buff=0.2)
+        content_group.next_to(category_label, DOWN, buff=0.8)
+        
+        self.play(Write(content_group), run_time=2)
+        self.wait(2)
+        
+        # Key concepts
+        concepts = $concepts
+        if concepts:
+            self.play(content_group.animate.scale(0.7).to_edge(LEFT))
+            
+            concepts_title = Text("Key Concepts:", font_size=28, color=YELLOW)
+            concepts_title.to_edge(RIGHT).shift(UP * 1.5)
+            self.play(Write(concepts_title))
+            
+            concept_group = VGroup()
+            for c in concepts:
+                bullet = Text(f"• {c}", font_size=22, color=$main_color)
+                concept_group.add(bullet)
+            
+            concept_group.arrange(DOWN, aligned_edge=LEFT, buff=0.3)
+            concept_group.next_to(concepts_title, DOWN, buff=0.5)
+            
+            for c in concept_group:
+                self.play(FadeIn(c, shift=LEFT), run_time=0.3)
+            
+            self.wait(2)
+        
+        # Transition out
+        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self.wait(0.5)
+''')
+
+# Plays every segment scene of a document in one render; it comes first in the
+# file so it is the scene render_animation picks, and the segment classes follow
+_DOCUMENT_ANIMATION_TEMPLATE = string.Template('''from manim import *
+
+class DocumentAnimation(Scene):
+    def construct(self):
+        for segment_scene in $scenes:
+            segment_scene.construct(self)
+''')
+_MANIM_IMPORT = "from manim import *\n"
+
+
+# Colors cycled through by the concept animation's concepts
+_CONCEPT_COLORS = ("RED", "GREEN", "YELLOW", "PURPLE", "ORANGE", "TEAL")
+
+# Segment header color per topic category
+_CATEGORY_COLORS = MappingProxyType({
+    'background': 'BLUE',
+    'problem_statement': 'RED',
+    'motivation': 'GREEN',
+    'approach': 'YELLOW',
+    'contributions': 'PURPLE',
+    'outline': 'ORANGE'
+})
+
+# Keywords marking a segment as quantum physics (see is_quantum_topic)
+_QUANTUM_KEYWORDS = (
+    'quantum', 'entangle', 'superposition', 'qubit', 'wave function',
+    'collapse', 'measurement', 'decoherence', 'tunneling', 'interference',
+    'bell', 'epr', 'teleportation', 'spin', 'coherence', 'bloch',
+    'schrodinger', 'heisenberg', 'uncertainty', 'observable', 'eigenstate',
+    'hilbert', 'hermitian', 'unitary', 'density matrix', 'mixed state',
+    'pure state', 'fidelity', 'tomography', 'error correction',
+    'non-local', 'spooky action', 'hidden variable'
+)
+_RE_QUANTUM_KEYWORD = re.compile('|'.join(map(re.escape, _QUANTUM_KEYWORDS)))
+
+# Quantum animation types with their trigger keywords, in priority order
+_QUANTUM_TYPE_KEYWORDS = (
+    ("entanglement", ('entangle', 'epr', 'bell', 'non-local', 'correlated')),
+    ("superposition", ('superposition', 'both states', 'simultaneously')),
+    ("tunneling", ('tunnel', 'barrier', 'forbidden')),
+    ("interference", ('interference', 'double.slit', 'fringe')),
+    ("decoherence", ('decoherence', 'environment', 'classical limit')),
+    ("measurement", ('measurement', 'collapse', 'observer')),
+    ("teleportation", ('teleport', 'transfer')),
+    ("wave_function", ('wave function', 'psi', 'schrodinger')),
+)
+_RE_QUANTUM_TYPES = tuple(
+    (quantum_type, re.compile('|'.join(map(re.escape, keywords))))
+    for quantum_type, keywords in _QUANTUM_TYPE_KEYWORDS
+)
+
+# Template function for each quantum animation type
+_QUANTUM_TEMPLATES = MappingProxyType({
+    "entanglement": quantum_templates.quantum_entanglement,
+    "superposition": quantum_templates.superposition_state,
+    "tunneling": quantum_templates.quantum_tunneling,
+    "interference": quantum_templates.quantum_interference,
+    "decoherence": quantum_templates.quantum_decoherence,
+    "measurement": quantum_templates.quantum_measurement,
+    "teleportation": quantum_templates.quantum_teleportation,
+    "wave_function": quantum_templates.wave_function_collapse,
+    "bell": quantum_templates.bell_inequality,
+    "epr": quantum_templates.epr_paradox,
+})
+
+
+def _quantum_template(quantum_type: str):
+    """Template function for a quantum type (entanglement if unknown)"""
+    return _QUANTUM_TEMPLATES.get(quantum_type, quantum_templates.quantum_entanglement)
+
+
 class ManimAnimationGenerator:
     """
     Generates Manim animations from research paper content
@@ -40,6 +639,53 @@ class ManimAnimationGenerator:
         self.fps = int(os.getenv("ANIMATION_FPS", "15"))  # Lower FPS for faster render
         self.render_timeout = int(os.getenv("RENDER_TIMEOUT", "180"))  # 3 min timeout (increased)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Rendered videos keyed by code hash, reused across runs
+        self.render_cache_dir = config.CACHE_DIR / "renders"
+        self.render_cache_dir.mkdir(parents=True, exist_ok=True)
+        # Compiled scene code kept by the render workers, so a script compiled
+        # by one run (or worker) isn't compiled again by the next
+        self.code_cache_dir = config.CACHE_DIR / "scene_code"
+        # Render in persistent worker processes instead of a cold `manim` CLI per call
+        self.use_render_worker = os.getenv("RENDER_WORKER", "1") == "1"
+        self.worker_max_jobs = int(os.getenv("RENDER_WORKER_MAX_JOBS", "20"))
+        # Memory budget per concurrent render in render_animations_batch
+        self.render_memory_gb = float(os.getenv("RENDER_MEMORY_PER_WORKER_GB", "1.5"))
+        # Per-scene progress messages from the code generators; off for quiet batches
+        self.verbose = os.getenv("ANIMATION_VERBOSE", "1") == "1"
+        self._init_render_state()
+    
+    def _init_render_state(self):
+        """Per-process render state (not picklable, rebuilt in worker processes)"""
+        self._workers = threading.local()
+        # Renders in progress, keyed by cache path, so duplicates wait for one render
+        self._inflight: Dict[Path, Future] = {}
+        self._inflight_lock = threading.Lock()
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in ("_workers", "_inflight", "_inflight_lock"):
+            state.pop(name, None)
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_render_state()
+    
+    def _run_manim(self, cmd: List[str], job: Dict[str, Any], timeout: int, cwd: Path) -> subprocess.CompletedProcess:
+        """Run a render on this thread's persistent worker, or the manim CLI if unavailable"""
+        if self.use_render_worker and not _RenderWorker.unavailable:
+            worker = getattr(self._workers, "worker", None)
+            if worker is None:
+                worker = self._workers.worker = _RenderWorker(self.worker_max_jobs)
+            result = worker.render(job, timeout)
+            if result is not None:
+                return result
+        return _run_cli(cmd, timeout, cwd)
+    
+    def _render_cache_path(self, code: str, quality: str) -> Path:
+        """Cache location for the video rendered from this code at this quality"""
+        digest = _hash(code.encode('utf-8')).hexdigest()
+        return self.render_cache_dir / f"{digest}_{quality}_{self.fps}.mp4"
     
     def _create_temp_script(self, code: str, scene_name: str) -> Path:
         """Create a temporary Python script with Manim code"""
@@ -48,74 +694,87 @@ class ManimAnimationGenerator:
         script_path.write_text(code, encoding='utf-8')
         return script_path
     
-    def _extract_scene_name(self, code: str) -> str:
+    @staticmethod
+    def _expected_output_path(
+        media_dir: Path,
+        script_path: Path,
+        scene_name: str,
+        quality: str,
+        fps: int
+    ) -> Optional[Path]:
+        """Where manim writes the video: media_dir/videos/<script stem>/<height>p<fps>/<scene>.mp4"""
+        height = _QUALITY_HEIGHTS.get(quality)
+        if height is None:
+            return None
+        return media_dir / "videos" / script_path.stem / f"{height}p{float(fps):g}" / f"{scene_name}.mp4"
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _extract_scene_name(code: str) -> str:
         """Extract the scene class name from Manim code"""
-        import re
-        match = re.search(r'class\s+(\w+)\s*\(\s*(?:Scene|MovingCameraScene|ThreeDScene|ZoomedScene)', code)
+        match = _RE_SCENE_CLASS.search(code)
         if match:
             scene_name = match.group(1)
             # Sanitize scene name - remove invalid characters
-            scene_name = re.sub(r'[^a-zA-Z0-9_]', '', scene_name)
+            scene_name = _RE_NON_IDENTIFIER.sub('', scene_name)
             if scene_name and scene_name[0].isdigit():
                 scene_name = 'Scene' + scene_name
             return scene_name if scene_name else "GeneratedScene"
         return "GeneratedScene"
     
-    def _sanitize_scene_name(self, name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _sanitize_scene_name(name: str) -> str:
         """Sanitize a string to be a valid Python class name"""
-        import re
+        # Already a single capitalized word (e.g. "Attention"): nothing to change
+        if name.isascii() and name.isalnum() and not name[0].isdigit() and name == name.capitalize():
+            return name
         # Remove invalid characters, keep alphanumeric and underscore
-        name = re.sub(r'[^a-zA-Z0-9_]', '', name.replace(' ', '_').replace('-', '_'))
+        name = _RE_NON_IDENTIFIER.sub('', name.replace(' ', '_').replace('-', '_'))
         # Ensure it starts with a letter
         if name and name[0].isdigit():
             name = 'Scene' + name
         # CamelCase conversion
-        parts = name.split('_')
-        name = ''.join(part.capitalize() for part in parts if part)
+        name = ''.join(part.capitalize() for part in name.split('_') if part)
         return name if name else "GeneratedScene"
     
     def _ensure_fadeouts_between_sections(self, code: str) -> str:
         """Ensure FadeOut is called between sections to prevent text overlap"""
-        import re
-        
-        # Pattern to find segment titles or section markers
-        # Add FadeOut before creating new segment titles if not already present
-        lines = code.split('\n')
-        new_lines = []
+        # Only lines that start a section or play/wait something can change
+        # the outcome, so the regex visits just those and leaves the rest alone
         prev_had_fadeout = True  # Assume start is clean
         
-        for i, line in enumerate(lines):
-            stripped = line.strip()
+        def visit(match):
+            nonlocal prev_had_fadeout
+            line = match.group(0)
+            lowered = line.lower()
             
             # Check if this line creates a segment title or major section
             is_new_section = (
-                'seg_title' in stripped.lower() or
-                'segment' in stripped.lower() and 'Text(' in stripped or
-                re.match(r'.*=\s*Text\(["\'](?:Segment|Section|Background|Problem|Approach|Method|Result|Conclusion)', stripped, re.IGNORECASE)
+                'seg_title' in lowered or
+                'segment' in lowered and 'Text(' in line or
+                _RE_SECTION_TITLE.match(line)
             )
             
             # If new section and previous lines don't have FadeOut, inject one
+            fadeout_line = ''
             if is_new_section and not prev_had_fadeout:
-                indent = len(line) - len(line.lstrip())
-                fadeout_line = ' ' * indent + 'self.play(*[FadeOut(m) for m in self.mobjects])'
-                new_lines.append(fadeout_line)
-            
-            new_lines.append(line)
+                fadeout_line = ' ' * len(match.group(1)) + 'self.play(*[FadeOut(m) for m in self.mobjects])\n'
             
             # Track if current line has FadeOut
-            if 'FadeOut' in stripped and 'self.mobjects' in stripped:
+            if 'FadeOut' in line and 'self.mobjects' in line:
                 prev_had_fadeout = True
-            elif 'self.play(' in stripped or 'self.wait(' in stripped:
+            elif 'self.play(' in line or 'self.wait(' in line:
                 prev_had_fadeout = False
+            return fadeout_line + line
         
-        return '\n'.join(new_lines)
+        return _RE_SECTION_SCAN_LINE.sub(visit, code)
     
-    def _inject_branding(self, code: str) -> str:
+    @staticmethod
+    def _inject_branding(code: str) -> str:
         """Inject 'Animation by Xe-Bot' branding at the end of construct method if not present"""
-        import re
-        
         # Check if branding already exists
-        if "Animation by Xe-Bot" in code or "Xe-Bot" in code:
+        if "Xe-Bot" in code:
             return code
         
         # Branding code to inject (with FadeOut to clear screen first)
@@ -127,50 +786,57 @@ class ManimAnimationGenerator:
         self.wait(2)
         self.play(FadeOut(branding))'''
         
-        # Find the end of the construct method (last line before class ends or file ends)
-        # Look for the construct method and inject branding before the method ends
-        lines = code.split('\n')
-        new_lines = []
-        inside_construct = False
-        construct_indent = 0
-        injected = False
-        
-        for i, line in enumerate(lines):
-            # Detect construct method start
-            if 'def construct(self' in line:
-                inside_construct = True
-                construct_indent = len(line) - len(line.lstrip())
-                new_lines.append(line)
-                continue
-            
-            # If inside construct, check for method end
-            if inside_construct and not injected:
-                # Check if this line is at same or lower indent level (method end)
-                stripped = line.strip()
-                if stripped and not stripped.startswith('#'):
-                    current_indent = len(line) - len(line.lstrip())
-                    
-                    # If we hit a new method definition or class, inject before
-                    if current_indent <= construct_indent and ('def ' in line or 'class ' in line):
-                        # Inject branding before this line
-                        indent = ' ' * (construct_indent + 4)
-                        new_lines.append(branding_code.replace('\n        ', f'\n{indent}'))
-                        injected = True
-                        inside_construct = False
-            
-            new_lines.append(line)
-        
-        # If still not injected (construct is the last method), append at the end
-        if not injected:
-            # Find the last non-empty line's indent that's inside construct
-            indent = '        '  # Default 8 spaces
-            new_lines.append(branding_code.replace('\n        ', f'\n{indent}'))
-        
-        return '\n'.join(new_lines)
+        # Inject right after the last line of construct(); the parse is shared
+        # with (and usually cached from) the syntax check
+        tree, _ = _parse(code)
+        construct = _construct_method(tree) if tree is not None else None
+        if construct is not None:
+            indent = ' ' * (construct.col_offset + 4)
+            branding = branding_code.replace('\n        ', f'\n{indent}')
+            end_lineno = construct.end_lineno
+            if construct.body[0].lineno == construct.lineno:
+                # One-line construct(): move its body under the def so the
+                # branding can follow it as a block (col_offset counts UTF-8 bytes)
+                lines = code.split('\n')
+                line = lines[construct.lineno - 1].encode()
+                split = construct.body[0].col_offset
+                lines[construct.lineno - 1] = (
+                    f"{line[:split].decode().rstrip()}\n{indent}{line[split:].decode()}"
+                )
+                code = '\n'.join(lines)
+                end_lineno += 1
+            pos = -1
+            for _ in range(end_lineno):
+                pos = code.find('\n', pos + 1)
+                if pos == -1:
+                    return code + branding + '\n'
+            return code[:pos] + branding + code[pos:]
+        
+        # construct() wasn't found; append at the end
+        return code + '\n' + branding_code
     
-    def _ensure_valid_manim_code(self, code: str) -> str:
-        """Ensure the code has proper Manim imports, structure, and FadeOuts between sections"""
-        import re
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _ensure_valid_manim_code(code: str) -> str:
+        """
+        Ensure the code has proper Manim imports, structure, and FadeOuts between sections
+        
+        Pure in `code`, so results are memoized; retries and fallbacks that
+        resubmit the same code skip the cleanup passes.
+        """
+        # Fast path: code that already has its imports, scene and branding and
+        # holds nothing the passes below would rewrite only needs the syntax check
+        if (
+            "from manim import" in code and "class" in code and "Scene" in code
+            and "Xe-Bot" in code
+            and ("np." not in code or "import numpy" in code)
+            and code.isascii()
+            and not any(trigger in code for trigger in _CLEANUP_TRIGGERS)
+            and not _RE_CLEANUP_TRIGGER.search(code)
+        ):
+            if _parse(code)[1] is None:
+                return code
+            # Otherwise the full pipeline below reports it and swaps in the fallback
         
         # Check if imports exist
         if "from manim import" not in code and "import manim" not in code:
@@ -182,59 +848,40 @@ class ManimAnimationGenerator:
             code = "import numpy as np\n" + code
         
         # Replace any MathTex/Tex with Text to avoid LaTeX requirement
-        code = re.sub(r'MathTex\s*\(', 'Text(', code)
-        code = re.sub(r'(?<!Ma)Tex\s*\(', 'Text(', code)  # Tex but not MathTex
+        # (each pass only runs when its literal prefix is present at all)
+        if 'MathTex' in code:
+            code = _RE_MATHTEX.sub('Text(', code)
+        if 'Tex' in code:
+            code = _RE_TEX.sub('Text(', code)  # Tex but not MathTex
         
         # Remove LaTeX-specific formatting that won't work with Text
-        code = re.sub(r'\\\\frac\{[^}]*\}\{[^}]*\}', 'fraction', code)
-        code = re.sub(r'\\\\[a-zA-Z]+\{[^}]*\}', '', code)  # Remove LaTeX commands
-        code = re.sub(r'\$[^$]+\$', '', code)  # Remove inline math
-        
-        # Replace problematic unicode characters
-        code = code.replace('•', '-')
-        code = code.replace('→', '->')
-        code = code.replace('←', '<-')
-        code = code.replace('≈', '~')
-        code = code.replace('≠', '!=')
-        code = code.replace('≤', '<=')
-        code = code.replace('≥', '>=')
-        code = code.replace('"', '"').replace('"', '"')  # Smart quotes
-        code = code.replace(''', "'").replace(''', "'")  # Smart apostrophes
-        code = code.replace('…', '...')  # Ellipsis
-        code = code.replace('–', '-').replace('—', '-')  # Dashes
-        code = code.replace('α', 'alpha').replace('β', 'beta').replace('γ', 'gamma')
-        code = code.replace('Δ', 'Delta').replace('δ', 'delta')
-        code = code.replace('π', 'pi').replace('σ', 'sigma').replace('μ', 'mu')
-        code = code.replace('∞', 'infinity').replace('∑', 'sum')
+        if '\\\\' in code:
+            code = _RE_LATEX_FRAC.sub('fraction', code)
+            code = _RE_LATEX_COMMAND.sub('', code)  # Remove LaTeX commands
+        if '$' in code:
+            code = _RE_INLINE_MATH.sub('', code)  # Remove inline math
         
-        # Fix common Manim errors
-        # 1. Fix empty VGroup animations
-        code = re.sub(r'self\.play\(\*\[\s*\]\)', '# Empty animation removed', code)
+        # Replace problematic unicode characters (one pass over the code)
+        code = code.translate(_UNICODE_FIXES)
         
-        # 2. Fix FadeIn/FadeOut with empty lists
-        code = re.sub(r'self\.play\(\*\[FadeOut\(m\) for m in \[\]\]\)', '# Empty FadeOut removed', code)
-        code = re.sub(r'self\.play\(\*\[FadeIn\(m\) for m in \[\]\]\)', '# Empty FadeIn removed', code)
+        # Fix common Manim errors
+        # 1, 2, 4, 5, 13, 17-20. Simple constant fixes in a single pass:
+        # empty play/FadeOut/FadeIn lists, scale(0), Fadeout/Fadein typos,
+        # empty Flash(), GREY -> GRAY, non-positive wait(), empty Text(),
+        # VGroup(None)
+        code = _RE_SIMPLE_FIXES.sub(lambda m: _SIMPLE_FIX_REPLACEMENTS[m.lastindex], code)
         
         # 3. Ensure run_time is positive
-        code = re.sub(r'run_time\s*=\s*0([,\)])', r'run_time=0.1\1', code)
-        code = re.sub(r'run_time\s*=\s*-', 'run_time=0.5', code)
-        
-        # 4. Fix scale(0) which causes issues
-        code = re.sub(r'\.scale\(0\)', '.scale(0.01)', code)
-        
-        # 5. Fix common typos
-        code = re.sub(r'Fadeout', 'FadeOut', code)
-        code = re.sub(r'Fadein', 'FadeIn', code)
-        code = re.sub(r'fadeout', 'FadeOut', code)
-        code = re.sub(r'fadein', 'FadeIn', code)
+        code = _RE_ZERO_RUN_TIME.sub(r'run_time=0.1\1', code)
+        code = _RE_NEGATIVE_RUN_TIME.sub('run_time=0.5', code)
         
         # 6. Ensure proper color constants (fix common issues)
-        code = re.sub(r'\bWHITE\s*=', 'WHITE_VAR =', code)  # Don't override constants
-        code = re.sub(r'\bBLUE\s*=', 'BLUE_VAR =', code)
-        code = re.sub(r'\bRED\s*=', 'RED_VAR =', code)
+        code = _RE_ASSIGN_WHITE.sub('WHITE_VAR =', code)  # Don't override constants
+        code = _RE_ASSIGN_BLUE.sub('BLUE_VAR =', code)
+        code = _RE_ASSIGN_RED.sub('RED_VAR =', code)
         
         # 7. Fix multiple inheritance issues
-        code = re.sub(r'class\s+(\w+)\s*\(\s*Scene\s*,\s*Scene\s*\)', r'class \1(Scene)', code)
+        code = _RE_DOUBLE_SCENE_BASE.sub(r'class \1(Scene)', code)
         
         # 8. Limit text length to prevent rendering issues
         def limit_text_length(match):
@@ -242,7 +889,7 @@ class ManimAnimationGenerator:
             if len(text) > 60:
                 text = text[:57] + "..."
             return f'Text("{text}"'
-        code = re.sub(r'Text\(["\']([^"\']{61,})["\']', limit_text_length, code)
+        code = _RE_LONG_TEXT.sub(limit_text_length, code)
         
         # 9. Ensure there's a wait at the end before fadeout to prevent abrupt endings
         if 'self.play(*[FadeOut(m) for m in self.mobjects])' in code:
@@ -252,7 +899,7 @@ class ManimAnimationGenerator:
             )
         
         # 10. Fix potential division by zero in loops
-        code = re.sub(r'/\s*0([^\d.])', r'/1\1', code)
+        code = _RE_DIVIDE_BY_ZERO.sub(r'/1\1', code)
         
         # 11. Add safety check for mobjects before FadeOut
         code = code.replace(
@@ -261,10 +908,7 @@ class ManimAnimationGenerator:
         )
         
         # 12. Fix common issues with LaggedStart
-        code = re.sub(r'LaggedStart\(\*\[\s*\]', 'LaggedStart(*[Wait(0.1)]', code)
-        
-        # 13. Fix Flash import/usage (Flash might need explicit position)
-        code = re.sub(r'Flash\(\s*\)', 'Flash(ORIGIN)', code)
+        code = _RE_EMPTY_LAGGED_START.sub('LaggedStart(*[Wait(0.1)]', code)
         
         # 14. Fix Arrow3D for non-3D scenes (replace with Arrow)
         if 'ThreeDScene' not in code and 'Arrow3D' in code:
@@ -272,34 +916,10 @@ class ManimAnimationGenerator:
             code = code.replace('Dot3D', 'Dot')
         
         # 15. Fix invalid numpy operations
-        code = re.sub(r'np\.array\(\[([^\]]*)\]\s*\)', lambda m: f'np.array([{m.group(1)}])', code)
+        code = _RE_NP_ARRAY.sub(lambda m: f'np.array([{m.group(1)}])', code)
         
         # 16. Remove any print statements that might cause issues
-        code = re.sub(r'^\s*print\(.*\)\s*$', '# print removed', code, flags=re.MULTILINE)
-        
-        # 17. Fix common NameError for undefined colors
-        color_fixes = {
-            'GREY': 'GRAY',
-            'GREY_A': 'GRAY_A', 
-            'GREY_B': 'GRAY_B',
-            'GREY_C': 'GRAY_C',
-            'GREY_D': 'GRAY_D',
-            'GREY_E': 'GRAY_E',
-        }
-        for wrong, correct in color_fixes.items():
-            code = code.replace(wrong, correct)
-        
-        # 18. Ensure self.wait() has positive duration
-        code = re.sub(r'self\.wait\(\s*0\s*\)', 'self.wait(0.1)', code)
-        code = re.sub(r'self\.wait\(\s*-', 'self.wait(0.5', code)
-        
-        # 19. Fix issue with empty Text() calls
-        code = re.sub(r'Text\(\s*\)', 'Text(" ")', code)
-        code = re.sub(r'Text\(\s*""\s*\)', 'Text(" ")', code)
-        code = re.sub(r"Text\(\s*''\s*\)", 'Text(" ")', code)
-        
-        # 20. Fix VGroup with None elements
-        code = re.sub(r'VGroup\(\s*None\s*\)', 'VGroup()', code)
+        code = _RE_PRINT_LINE.sub('# print removed', code)
         
         # Check if there's a Scene class
         if "class" not in code or "Scene" not in code:
@@ -322,39 +942,28 @@ class GeneratedScene(Scene):
 '''
         
         # Validate Python syntax
-        try:
-            compile(code, '<string>', 'exec')
-        except SyntaxError as e:
-            console.print(f"[yellow]Warning: Code has syntax error: {e}[/yellow]")
+        _, error = _parse(code)
+        if error is not None:
+            console.print(f"[yellow]Warning: Code has syntax error: {error}[/yellow]")
             # Return a fallback animation
-            code = f'''from manim import *
-
-class GeneratedScene(Scene):
-    def construct(self):
-        title = Text("Animation Generation Error", font_size=36, color=RED)
-        subtitle = Text("Using fallback animation", font_size=24)
-        subtitle.next_to(title, DOWN)
-        self.play(Write(title), FadeIn(subtitle))
-        self.wait(2)
-        self.play(FadeOut(title), FadeOut(subtitle))
-        
-        # Branding
-        branding = Text("Animation by Xe-Bot", font_size=36, color=BLUE)
-        self.play(FadeIn(branding))
-        self.wait(2)
-        self.play(FadeOut(branding))
-'''
+            code = _SYNTAX_ERROR_SCENE
         
         # Inject branding if not present
-        code = self._inject_branding(code)
+        code = ManimAnimationGenerator._inject_branding(code)
         
         return code
     
+    @staticmethod
+    def is_usable_code(code: str) -> bool:
+        """Whether code survives _ensure_valid_manim_code rather than being replaced by the error scene"""
+        return ManimAnimationGenerator._ensure_valid_manim_code(code) != _SYNTAX_ERROR_SCENE
+    
     def render_animation(
         self,
         manim_code: str,
         output_name: str,
-        quality: Optional[str] = None
+        quality: Optional[str] = None,
+        pre_validated: bool = False
     ) -> AnimationResult:
         """
         Render a Manim animation from code
@@ -363,6 +972,7 @@ class GeneratedScene(Scene):
             manim_code: Valid Manim Python code
             output_name: Name for the output file
             quality: Quality setting (low_quality, medium_quality, high_quality)
+            pre_validated: Code already went through _ensure_valid_manim_code
         
         Returns:
             AnimationResult with status and file path
@@ -370,11 +980,62 @@ class GeneratedScene(Scene):
         quality = quality or self.quality
         
         # Ensure valid code
-        manim_code = self._ensure_valid_manim_code(manim_code)
+        if not pre_validated:
+            manim_code = self._ensure_valid_manim_code(manim_code)
         
         # Extract scene name
         scene_name = self._extract_scene_name(manim_code)
         
+        # Identical code renders to an identical video; reuse a cached render
+        cached_file = self._render_cache_path(manim_code, quality)
+        if cached_file.exists():
+            try:
+                output_path = self.output_dir / f"{output_name}_{time.strftime('%Y%m%d_%H%M%S')}.mp4"
+                shutil.copy2(cached_file, output_path)
+                console.print(f"[green]✓ Using cached render for {scene_name}: {output_path}[/green]")
+                return AnimationResult(
+                    success=True,
+                    file_path=str(output_path),
+                    manim_code=manim_code,
+                    duration_seconds=self._get_video_duration(output_path)
+                )
+            except OSError:
+                pass  # Fall through to a fresh render
+        
+        # The same code submitted concurrently waits for the first render
+        # instead of rendering it twice
+        with self._inflight_lock:
+            pending = self._inflight.get(cached_file)
+            if pending is None:
+                future = self._inflight[cached_file] = Future()
+        if pending is not None:
+            try:
+                result = pending.result(timeout=self.render_timeout)
+            except TimeoutError:
+                result = None
+            if result is not None and not cached_file.exists():
+                # Failed (or fell back), so there's nothing cached to copy; share the outcome
+                return result
+            return self.render_animation(manim_code, output_name, quality, pre_validated=True)
+        
+        result = None
+        try:
+            result = self._render_fresh(manim_code, output_name, quality, scene_name, cached_file)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cached_file)
+            future.set_result(result)
+    
+    def _render_fresh(
+        self,
+        manim_code: str,
+        output_name: str,
+        quality: str,
+        scene_name: str,
+        cached_file: Path
+    ) -> AnimationResult:
+        """Render sanitized code that has no cached video yet"""
         console.print(f"[blue]Rendering animation: {scene_name}[/blue]")
         
         # Create temp script
@@ -391,8 +1052,6 @@ class GeneratedScene(Scene):
             elif quality == "high_quality":
                 quality_flag = "-qh"
             
-            output_path = self.output_dir / f"{output_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4"
-            
             # Use absolute path for media_dir
             media_dir = Path("output/animations").absolute()
             media_dir.mkdir(parents=True, exist_ok=True)
@@ -401,6 +1060,9 @@ class GeneratedScene(Scene):
                 "manim",
                 quality_flag,
                 "--fps", str(self.fps),
+                # Frames already stream straight into the encoder; skip manim's
+                # per-animation hashing, renders are cached by code hash above
+                "--disable_caching",
                 "-o", f"{scene_name}.mp4",
                 "--media_dir", str(media_dir),
                 str(script_path),
@@ -408,26 +1070,28 @@ class GeneratedScene(Scene):
             ]
             
             console.print(f"[cyan]Running: {' '.join(cmd)}[/cyan]")
+            expected_file = self._expected_output_path(media_dir, script_path, scene_name, quality, self.fps)
             
-            # Run manim with configurable timeout
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.render_timeout,  # Configurable timeout (default 2 min)
-                cwd=temp_dir
-            )
+            job = {
+                "id": uuid.uuid4().hex,
+                "script_path": str(script_path),
+                "scene_name": scene_name,
+                "quality": quality,
+                "fps": self.fps,
+                "media_dir": str(media_dir),
+                "output_file": f"{scene_name}.mp4",
+                "code_cache_dir": str(self.code_cache_dir)
+            }
             
-            # Log output for debugging
-            if result.stdout:
-                console.print(f"[dim]Manim stdout: {result.stdout[:200]}[/dim]")
+            # Run manim with configurable timeout
+            result = self._run_manim(cmd, job, self.render_timeout, temp_dir)
             
             if result.returncode != 0:
                 error_msg = result.stderr or result.stdout or "Unknown error"
                 
                 # Check if the file was actually created despite the error
                 # (sometimes manim returns error code but still produces output)
-                output_file = self._find_output_file(output_name, scene_name)
+                output_file = self._find_output_file(output_name, scene_name, expected_file)
                 # Verify the file was created recently (within last 30 seconds) to avoid picking up old files
                 if output_file and output_file.exists() and output_file.stat().st_size > 1000:
                     file_age = time.time() - output_file.stat().st_mtime
@@ -461,10 +1125,18 @@ class GeneratedScene(Scene):
                 )
             
             # Find the output file
-            output_file = self._find_output_file(output_name, scene_name)
+            output_file = self._find_output_file(output_name, scene_name, expected_file)
             
             if output_file:
                 console.print(f"[green]✓ Animation rendered: {output_file}[/green]")
+                # Copy-then-rename so a failed copy (e.g. a full disk) never
+                # leaves a truncated video that later runs would serve
+                tmp_file = cached_file.with_name(f"{cached_file.name}.{uuid.uuid4().hex}.tmp")
+                try:
+                    shutil.copy2(output_file, tmp_file)
+                    os.replace(tmp_file, cached_file)
+                except OSError:
+                    tmp_file.unlink(missing_ok=True)
                 return AnimationResult(
                     success=True,
                     file_path=str(output_file),
@@ -496,10 +1168,7 @@ class GeneratedScene(Scene):
             )
         finally:
             # Cleanup temp directory
-            try:
-                shutil.rmtree(temp_dir)
-            except:
-                pass
+            _remove_dir_later(temp_dir)
     
     def _render_fallback_animation(self, scene_name: str, media_dir: Path) -> Optional[Path]:
         """Render a simple but visually appealing fallback animation when main generation fails"""
@@ -570,36 +1239,64 @@ class {safe_scene_name}(Scene):
             script_path.write_text(fallback_code, encoding='utf-8')
             
             cmd = [
-                "manim", "-ql", "--fps", "30",
+                "manim", "-ql", "--fps", "30", "--disable_caching",
                 "-o", f"{safe_scene_name}.mp4",
                 "--media_dir", str(media_dir),
                 str(script_path), safe_scene_name
             ]
             
             console.print(f"[dim]Running fallback: {' '.join(cmd[:5])}...[/dim]")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=90, cwd=temp_dir)
+            job = {
+                "id": uuid.uuid4().hex,
+                "script_path": str(script_path),
+                "scene_name": safe_scene_name,
+                "quality": "low_quality",
+                "fps": 30,
+                "media_dir": str(media_dir),
+                "output_file": f"{safe_scene_name}.mp4",
+                "code_cache_dir": str(self.code_cache_dir)
+            }
+            result = self._run_manim(cmd, job, 90, temp_dir)
             
             if result.returncode == 0:
-                # Find the output
+                # Find the output, trying manim's known output path first
+                expected_file = self._expected_output_path(media_dir, script_path, safe_scene_name, "low_quality", 30)
+                if expected_file.exists():
+                    console.print(f"[green]Fallback animation created: {expected_file.name}[/green]")
+                    _remove_dir_later(temp_dir)
+                    return expected_file
                 for mp4 in media_dir.rglob("*.mp4"):
                     if safe_scene_name in mp4.stem and "partial" not in str(mp4):
                         console.print(f"[green]Fallback animation created: {mp4.name}[/green]")
-                        shutil.rmtree(temp_dir, ignore_errors=True)
+                        _remove_dir_later(temp_dir)
                         return mp4
             else:
                 console.print(f"[red]Fallback failed: {result.stderr[:200] if result.stderr else 'Unknown error'}[/red]")
             
-            shutil.rmtree(temp_dir, ignore_errors=True)
+            _remove_dir_later(temp_dir)
             return None
         except Exception as e:
             console.print(f"[red]Fallback exception: {str(e)[:100]}[/red]")
             return None
     
-    def _find_output_file(self, output_name: str, scene_name: str) -> Optional[Path]:
-        """Find the rendered output file"""
-        # Wait a moment for file system to sync
-        time.sleep(0.5)
-        
+    def _find_output_file(
+        self,
+        output_name: str,
+        scene_name: str,
+        expected: Optional[Path] = None
+    ) -> Optional[Path]:
+        """Find the rendered output file, checking manim's known output path first"""
+        if expected is not None:
+            # Poll briefly in case the file system hasn't caught up yet
+            for _ in range(5):
+                if expected.exists():
+                    return expected
+                time.sleep(0.1)
+        else:
+            # Wait a moment for file system to sync
+            time.sleep(0.5)
+        
+        # Otherwise scan the usual output locations
         # Check common output locations based on manim's output structure
         # Manim creates: media_dir/videos/script_name/quality/scene_name.mp4
         search_dirs = [
@@ -640,6 +1337,13 @@ class {safe_scene_name}(Scene):
     
     def _get_video_duration(self, video_path: Path) -> int:
         """Get video duration in seconds"""
+        # Read it straight from the MP4 header; ffprobe only for anything else
+        try:
+            duration = _mp4_duration(video_path)
+            if duration is not None:
+                return int(duration)
+        except (OSError, struct.error, IndexError):
+            pass
         try:
             result = subprocess.run(
                 ["ffprobe", "-v", "error", "-show_entries", "format=duration",
@@ -651,74 +1355,119 @@ class {safe_scene_name}(Scene):
         except:
             return 0
     
-    def create_text_animation(self, text: str, title: str = "Research Insight") -> str:
+    def _batch_concurrency(self, job_count: int) -> int:
+        """How many renders to run at once: bounded by CPUs, jobs and available memory"""
+        workers = min(os.cpu_count() or 1, job_count)
+        if psutil is not None:
+            budget = self.render_memory_gb * 1024 ** 3
+            workers = min(workers, int(psutil.virtual_memory().available // budget))
+        return max(1, workers)
+    
+    def render_animations_batch(
+        self,
+        jobs: List[Tuple[str, str]],
+        max_concurrency: Optional[int] = None,
+        quality: Optional[str] = None
+    ) -> List[AnimationResult]:
         """
-        Create a simple text-based animation
+        Render several animations concurrently
+        
+        Each render thread drives its own manim worker process, so renders
+        run in parallel without a process pool on top.
         
         Args:
-            text: Text content to animate
-            title: Title for the animation
+            jobs: (manim_code, output_name) pairs
+            max_concurrency: Renders at once; defaults to what CPUs and memory allow
+            quality: Quality setting for every job
         
         Returns:
-            Manim code string
+            AnimationResults in the same order as jobs
         """
-        # Escape special characters
-        text = text.replace('"', '\\"').replace('\n', '\\n')
-        title = title.replace('"', '\\"')
-        
-        # Split text into chunks for better display
-        words = text.split()
-        chunks = []
-        current_chunk = []
-        current_length = 0
-        
-        for word in words:
-            if current_length + len(word) > 50:
-                chunks.append(" ".join(current_chunk))
-                current_chunk = [word]
-                current_length = len(word)
-            else:
-                current_chunk.append(word)
-                current_length += len(word) + 1
-        
-        if current_chunk:
-            chunks.append(" ".join(current_chunk))
+        if not jobs:
+            return []
+        workers = max_concurrency or self._batch_concurrency(len(jobs))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="xebot-batch-render") as pool:
+            return list(pool.map(
+                lambda job: self.render_animation(job[0], job[1], quality),
+                jobs
+            ))
+    
+    def concat_videos(self, video_paths: List[str], output_name: str) -> AnimationResult:
+        """
+        Join rendered videos into one file with ffmpeg's concat demuxer
         
-        # Generate animation code
-        code = f'''from manim import *
-
-class ResearchAnimation(Scene):
-    def construct(self):
-        # Title
-        title = Text("{title}", font_size=42, color=BLUE)
-        title.to_edge(UP)
-        self.play(Write(title))
-        self.wait(0.5)
+        Args:
+            video_paths: Paths of the videos to join, in order
+            output_name: Name for the output file
         
-        # Content chunks
-        chunks = {chunks}
+        Returns:
+            AnimationResult with status and file path
+        """
+        output_path = self.output_dir / f"{output_name}_{time.strftime('%Y%m%d_%H%M%S')}.mp4"
+        temp_dir = Path(tempfile.mkdtemp())
+        list_path = temp_dir / "videos.txt"
         
-        previous_text = None
-        for i, chunk in enumerate(chunks):
-            text = Text(chunk, font_size=28)
-            text.next_to(title, DOWN, buff=1.5)
+        try:
+            # Concat list entries are single-quoted; escape embedded quotes
+            entries = []
+            for video_path in video_paths:
+                escaped = Path(video_path).absolute().as_posix().replace("'", "'\\''")
+                entries.append(f"file '{escaped}'\n")
+            list_path.write_text("".join(entries), encoding='utf-8')
             
-            if previous_text:
-                self.play(
-                    FadeOut(previous_text),
-                    FadeIn(text)
+            # Segments share resolution and codec, so streams are copied without re-encoding
+            result = subprocess.run(
+                ["ffmpeg", "-y", "-v", "error", "-f", "concat", "-safe", "0",
+                 "-i", str(list_path), "-c", "copy", str(output_path)],
+                capture_output=True,
+                text=True,
+                timeout=self.render_timeout
+            )
+            
+            if result.returncode != 0 or not output_path.exists():
+                return AnimationResult(
+                    success=False,
+                    file_path=None,
+                    manim_code="",
+                    error_message=result.stderr or "ffmpeg concat failed"
                 )
-            else:
-                self.play(Write(text))
             
-            self.wait(2)
-            previous_text = text
+            console.print(f"[green]✓ Videos concatenated: {output_path}[/green]")
+            return AnimationResult(
+                success=True,
+                file_path=str(output_path),
+                manim_code="",
+                duration_seconds=self._get_video_duration(output_path)
+            )
+        except Exception as e:
+            return AnimationResult(
+                success=False,
+                file_path=None,
+                manim_code="",
+                error_message=str(e)
+            )
+        finally:
+            _remove_dir_later(temp_dir)
+    
+    def create_text_animation(self, text: str, title: str = "Research Insight") -> str:
+        """
+        Create a simple text-based animation
         
-        # Fade out
-        self.play(FadeOut(title), FadeOut(previous_text))
-        self.wait(0.5)
-'''
-        return code
+        Args:
+            text: Text content to animate
+            title: Title for the animation
+        
+        Returns:
+            Manim code string
+        """
+        # Split text into chunks for better display
+        chunks = textwrap.wrap(text, width=50, break_long_words=False, break_on_hyphens=False)
+        
+        code = _TEXT_ANIMATION_TEMPLATE.substitute(
+            title=json.dumps(title, ensure_ascii=False),
+            chunks=json.dumps(chunks, ensure_ascii=False)
+        )
+        return self._ensure_valid_manim_code(code)
     
     def create_concept_animation(
         self,
@@ -735,59 +1484,29 @@ class ResearchAnimation(Scene):
         Returns:
             Manim code string
         """
-        concepts_str = str(concepts)
-        
-        code = f'''from manim import *
-
-class ConceptAnimation(Scene):
-    def construct(self):
-        # Title
-        title = Text("{title}", font_size=48, color=BLUE)
-        self.play(Write(title))
-        self.wait(1)
-        self.play(title.animate.to_edge(UP))
-        
-        # Concepts
-        concepts = {concepts_str}
-        
-        concept_mobjects = []
-        colors = [RED, GREEN, YELLOW, PURPLE, ORANGE, TEAL]
-        
-        for i, concept in enumerate(concepts):
-            color = colors[i % len(colors)]
-            text = Text(concept, font_size=32, color=color)
-            concept_mobjects.append(text)
-        
-        # Arrange concepts
-        group = VGroup(*concept_mobjects)
-        group.arrange(DOWN, buff=0.5)
-        group.next_to(title, DOWN, buff=1)
-        
-        # Animate each concept
-        for i, mob in enumerate(concept_mobjects):
-            self.play(FadeIn(mob, shift=RIGHT), run_time=0.5)
-            self.wait(0.3)
-        
-        self.wait(2)
-        
-        # Highlight each concept
-        for mob in concept_mobjects:
-            self.play(
-                mob.animate.scale(1.2),
-                rate_func=there_and_back,
-                run_time=0.5
-            )
-        
-        self.wait(1)
-        
-        # Fade out
-        self.play(FadeOut(group), FadeOut(title))
-'''
-        return code
+        return self._concept_code(title, tuple(concepts))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _concept_code(title: str, concepts: Tuple[str, ...]) -> str:
+        """Code for create_concept_animation; memoized since regenerations repeat inputs"""
+        # The concepts are known now, so build their Text mobjects inline
+        # rather than looping over a list in the scene
+        concept_texts = "".join(
+            f"\n            Text({json.dumps(concept, ensure_ascii=False)}, font_size=32, color={_CONCEPT_COLORS[i % len(_CONCEPT_COLORS)]}),"
+            for i, concept in enumerate(concepts)
+        )
+        if concept_texts:
+            concept_texts += "\n        "
+        code = _CONCEPT_ANIMATION_TEMPLATE.substitute(
+            title=json.dumps(title, ensure_ascii=False),
+            concept_texts=concept_texts
+        )
+        return ManimAnimationGenerator._ensure_valid_manim_code(code)
     
     def create_segment_animation(
         self,
-        segment: Dict[str, Any],
+        segment: Union[Dict[str, Any], SegmentView],
         segment_number: int
     ) -> str:
         """
@@ -800,99 +1519,88 @@ class ConceptAnimation(Scene):
         Returns:
             Manim code string
         """
-        topic = segment.get('topic', f'Segment {segment_number}')
-        category = segment.get('topic_category', 'general')
-        content = segment.get('content', '')[:300]  # Limit content length
-        concepts = segment.get('key_concepts', [])[:5]  # Limit concepts
-        
-        # Escape strings
-        topic = topic.replace('"', '\\"')
-        content = content.replace('"', '\\"').replace('\n', ' ')
+        return self._ensure_valid_manim_code(self._segment_scene(segment, segment_number))
+    
+    def _segment_scene(self, segment: Union[Dict[str, Any], SegmentView], segment_number: int) -> str:
+        """Uncleaned scene code for a segment, so a document can be cleaned as a whole"""
+        view = _segment_view(segment)
+        return self._segment_code(
+            segment_number,
+            view.topic or f'Segment {segment_number}',
+            view.topic_category,
+            view.content[:300],  # Limit content length
+            view.key_concepts[:5]  # Limit concepts
+        )
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _segment_code(
+        segment_number: int,
+        topic: str,
+        category: str,
+        content: str,
+        concepts: Tuple[str, ...]
+    ) -> str:
+        """Code for create_segment_animation; memoized since regenerations repeat segments"""
+        # Wrap the content into 45-character lines here rather than in the scene
+        lines = _wrap_content(content)[:6]  # Max 6 lines
         
         # Color scheme based on category
-        color_map = {
-            'background': 'BLUE',
-            'problem_statement': 'RED',
-            'motivation': 'GREEN',
-            'approach': 'YELLOW',
-            'contributions': 'PURPLE',
-            'outline': 'ORANGE'
-        }
-        main_color = color_map.get(category, 'WHITE')
-        
-        code = f'''from manim import *
-
-class Segment{segment_number}Animation(Scene):
-    def construct(self):
-        # Segment header
-        header = Text("Segment {segment_number}: {topic}", font_size=36, color={main_color})
-        header.to_edge(UP)
-        
-        category_label = Text("[{category}]", font_size=24, color=GRAY)
-        category_label.next_to(header, DOWN)
-        
-        self.play(Write(header))
-        self.play(FadeIn(category_label))
-        self.wait(1)
-        
-        # Content summary
-        content_text = "{content}"
-        
-        # Split into lines
-        words = content_text.split()
-        lines = []
-        current_line = []
-        
-        for word in words:
-            current_line.append(word)
-            if len(" ".join(current_line)) > 45:
-                lines.append(" ".join(current_line[:-1]))
-                current_line = [word]
-        if current_line:
-            lines.append(" ".join(current_line))
+        main_color = _CATEGORY_COLORS.get(category, 'WHITE')
+        
+        code = _SEGMENT_ANIMATION_TEMPLATE.substitute(
+            segment_number=segment_number,
+            header=json.dumps(f"Segment {segment_number}: {topic}", ensure_ascii=False),
+            category_label=json.dumps(f"[{category}]", ensure_ascii=False),
+            lines=json.dumps(list(lines), ensure_ascii=False),
+            concepts=json.dumps(concepts, ensure_ascii=False),
+            main_color=main_color
+        )
+        return code
+    
+    def generate_segments(
+        self,
+        segments: List[Union[Dict[str, Any], SegmentView]],
+        start_number: int = 1
+    ) -> List[str]:
+        """
+        Create animations for several segments at once
         
-        content_group = VGroup()
-        for line in lines[:6]:  # Max 6 lines
-            text = Text(line, font_size=24)
-            content_group.add(text)
+        Args:
+            segments: Segment data with content, topic, concepts, in order
+            start_number: Segment number of the first segment
         
-        content_group.arrange(DOWN, aligned_edge=LEFT, buff=0.2)
-        content_group.next_to(category_label, DOWN, buff=0.8)
+        Returns:
+            Manim code strings, one per segment
+        """
+        create = self.create_segment_animation
+        return [create(segment, number) for number, segment in enumerate(segments, start_number)]
+    
+    def create_document_animation(self, segments: List[Union[Dict[str, Any], SegmentView]]) -> str:
+        """
+        Create one animation file covering all segments of a document
         
-        self.play(Write(content_group), run_time=2)
-        self.wait(2)
+        Each segment keeps its own SegmentNAnimation scene, and a leading
+        DocumentAnimation scene plays them back to back, so the whole document
+        renders in a single manim run instead of one run per segment.
         
-        # Key concepts
-        concepts = {concepts}
-        if concepts:
-            self.play(content_group.animate.scale(0.7).to_edge(LEFT))
-            
-            concepts_title = Text("Key Concepts:", font_size=28, color=YELLOW)
-            concepts_title.to_edge(RIGHT).shift(UP * 1.5)
-            self.play(Write(concepts_title))
-            
-            concept_group = VGroup()
-            for c in concepts:
-                bullet = Text(f"• {{c}}", font_size=22, color={main_color})
-                concept_group.add(bullet)
-            
-            concept_group.arrange(DOWN, aligned_edge=LEFT, buff=0.3)
-            concept_group.next_to(concepts_title, DOWN, buff=0.5)
-            
-            for c in concept_group:
-                self.play(FadeIn(c, shift=LEFT), run_time=0.3)
-            
-            self.wait(2)
+        Args:
+            segments: Segment data with content, topic, concepts, in order
         
-        # Transition out
-        self.play(*[FadeOut(mob) for mob in self.mobjects])
-        self.wait(0.5)
-'''
-        return code
+        Returns:
+            Manim code string
+        """
+        scenes = ''.join(f"Segment{number}Animation, " for number in range(1, len(segments) + 1))
+        parts = [_DOCUMENT_ANIMATION_TEMPLATE.substitute(scenes=f"({scenes.rstrip()})")]
+        parts.extend(
+            self._segment_scene(segment, number).removeprefix(_MANIM_IMPORT)
+            for number, segment in enumerate(segments, 1)
+        )
+        return self._ensure_valid_manim_code('\n'.join(parts))
     
     def create_quantum_animation(
         self,
-        segment: Dict[str, Any],
+        segment: Union[Dict[str, Any], SegmentView],
         quantum_type: str = "auto"
     ) -> str:
         """
@@ -907,59 +1615,30 @@ class Segment{segment_number}Animation(Scene):
         Returns:
             Manim code string
         """
-        from src.animation.quantum_templates import quantum_templates
+        view = _segment_view(segment)
+        topic = view.topic or 'Quantum Concept'
         
-        topic = segment.get('topic', 'Quantum Concept')
-        content = segment.get('content', '').lower()
-        concepts = segment.get('key_concepts', [])
-        concepts_lower = ' '.join(concepts).lower()
-        
-        # Auto-detect quantum type from content
+        # Auto-detect quantum type from content: the first type (in priority
+        # order) with a keyword in the content or concepts; "\n" keeps matches
+        # from spanning the two. Lowercased once, as a whole
         if quantum_type == "auto":
-            if any(kw in content or kw in concepts_lower for kw in ['entangle', 'epr', 'bell', 'non-local', 'correlated']):
-                quantum_type = "entanglement"
-            elif any(kw in content or kw in concepts_lower for kw in ['superposition', 'both states', 'simultaneously']):
-                quantum_type = "superposition"
-            elif any(kw in content or kw in concepts_lower for kw in ['tunnel', 'barrier', 'forbidden']):
-                quantum_type = "tunneling"
-            elif any(kw in content or kw in concepts_lower for kw in ['interference', 'double.slit', 'fringe']):
-                quantum_type = "interference"
-            elif any(kw in content or kw in concepts_lower for kw in ['decoherence', 'environment', 'classical limit']):
-                quantum_type = "decoherence"
-            elif any(kw in content or kw in concepts_lower for kw in ['measurement', 'collapse', 'observer']):
-                quantum_type = "measurement"
-            elif any(kw in content or kw in concepts_lower for kw in ['teleport', 'transfer']):
-                quantum_type = "teleportation"
-            elif any(kw in content or kw in concepts_lower for kw in ['wave function', 'psi', 'schrodinger']):
-                quantum_type = "wave_function"
-            else:
-                # Default to entanglement for generic quantum topics
-                quantum_type = "entanglement"
-        
-        # Get the appropriate template
-        template_map = {
-            "entanglement": lambda t: quantum_templates.quantum_entanglement(t),
-            "superposition": lambda t: quantum_templates.superposition_state(t),
-            "tunneling": lambda t: quantum_templates.quantum_tunneling(t),
-            "interference": lambda t: quantum_templates.quantum_interference(t),
-            "decoherence": lambda t: quantum_templates.quantum_decoherence(t),
-            "measurement": lambda t: quantum_templates.quantum_measurement(t),
-            "teleportation": lambda t: quantum_templates.quantum_teleportation(t),
-            "wave_function": lambda t: quantum_templates.wave_function_collapse(t),
-            "bell": lambda t: quantum_templates.bell_inequality(t),
-            "epr": lambda t: quantum_templates.epr_paradox(t),
-        }
-        
-        template_func = template_map.get(quantum_type, template_map["entanglement"])
-        
-        # Generate the code using the template
-        code = template_func(topic)
-        
-        console.print(f"[cyan]Generated {quantum_type} quantum animation for: {topic}[/cyan]")
+            concepts = ' '.join(view.key_concepts)
+            search_text = f"{view.content}\n{concepts}".lower()
+            # Default to entanglement for generic quantum topics
+            quantum_type = next(
+                (name for name, pattern in _RE_QUANTUM_TYPES if pattern.search(search_text)),
+                "entanglement"
+            )
+        
+        # Generate the code using the appropriate template
+        code = _quantum_template(quantum_type)(topic)
+        
+        if self.verbose:
+            console.print(f"[cyan]Generated {quantum_type} quantum animation for: {topic}[/cyan]")
         
         return code
     
-    def is_quantum_topic(self, segment: Dict[str, Any]) -> bool:
+    def is_quantum_topic(self, segment: Union[Dict[str, Any], SegmentView]) -> bool:
         """
         Detect if a segment is about quantum physics.
         
@@ -969,23 +1648,16 @@ class Segment{segment_number}Animation(Scene):
         Returns:
             True if quantum-related topic
         """
-        quantum_keywords = [
-            'quantum', 'entangle', 'superposition', 'qubit', 'wave function',
-            'collapse', 'measurement', 'decoherence', 'tunneling', 'interference',
-            'bell', 'epr', 'teleportation', 'spin', 'coherence', 'bloch',
-            'schrodinger', 'heisenberg', 'uncertainty', 'observable', 'eigenstate',
-            'hilbert', 'hermitian', 'unitary', 'density matrix', 'mixed state',
-            'pure state', 'fidelity', 'tomography', 'error correction',
-            'non-local', 'spooky action', 'hidden variable'
-        ]
-        
-        content = segment.get('content', '').lower()
-        topic = segment.get('topic', '').lower()
-        concepts = ' '.join(segment.get('key_concepts', [])).lower()
+        # Most quantum segments say so in their (short) topic
+        view = _segment_view(segment)
+        topic = view.topic.lower()
+        if 'quantum' in topic or 'qubit' in topic:
+            return True
         
-        search_text = f"{content} {topic} {concepts}"
+        concepts = ' '.join(view.key_concepts)
+        search_text = f"{view.content.lower()} {topic} {concepts.lower()}"
         
-        return any(kw in search_text for kw in quantum_keywords)
+        return _RE_QUANTUM_KEYWORD.search(search_text) is not None
 
 
 # Global animation generator instance
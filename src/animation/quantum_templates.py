@@ -2,42 +2,64 @@
 Quantum Physics Animation Templates
 Specialized templates for quantum entanglement, superposition, and related quantum phenomena
 """
-from typing import List, Dict, Any
+import functools
+import string
+from typing import List, Dict, Any, Tuple
 
 
+# Characters that would break the title's string literal in generated code
+_TITLE_FIXES = str.maketrans({'"': "'", '\\': None, '\n': ' '})
+
+
+@functools.lru_cache(maxsize=256)
 def _sanitize_title(title: str, default: str = "Quantum Animation") -> str:
-    """Sanitize title for safe string embedding in generated code."""
+    """Sanitize title for safe string embedding in generated code (memoized; titles repeat)."""
     if not title:
         return default
-    # Remove problematic characters and limit length
-    title = title.replace('"', "'").replace('\\', '').replace('\n', ' ')
-    title = ''.join(c for c in title if ord(c) < 128)  # ASCII only
+    # Remove problematic characters, keep ASCII only and limit length
+    title = title.translate(_TITLE_FIXES).encode('ascii', 'ignore').decode('ascii')
     title = title.strip()[:50]
     return title if title else default
 
 
-class QuantumAnimationTemplates:
-    """Collection of quantum physics-specific Manim animation templates"""
-    
-    @staticmethod
-    def quantum_entanglement(title: str = "Quantum Entanglement", particles: int = 2) -> str:
-        """
-        Generate animation showing quantum entanglement between particles.
-        Shows correlated spins/states of entangled particles.
-        """
-        # Sanitize title for safe string embedding
-        title = title.replace('"', "'").replace('\\', '')[:50]
-        if not title:
-            title = "Quantum Entanglement"
-        
-        return f'''from manim import *
-import numpy as np
-
-class QuantumEntanglementAnimation(Scene):
+# Every quantum scene opens with the same title header and most end by fading
+# everything out; the templates below only hold what comes in between
+_SCENE_HEADER = '''from manim import *
+${numpy_import}
+class $scene_class($base):
     def construct(self):
         # Title
-        title_text = Text("{title}", font_size=32, color=BLUE)
+        title_text = Text("$$title", font_size=32, color=BLUE)
         title_text.to_edge(UP, buff=0.4)
+'''
+_SCENE_FOOTER = '''\
+        self.play(*[FadeOut(m) for m in self.mobjects if m is not None], run_time=0.8)
+'''
+
+
+def _scene_template(
+    scene_class: str,
+    body: str,
+    base: str = "Scene",
+    clean_exit: bool = True
+) -> Tuple[str, ...]:
+    """
+    Template for a scene class: the shared header, the body, then the fade-out
+    
+    Kept as the constant pieces around each $title, so filling it in is a
+    single str.join.
+    """
+    # numpy is only imported by the scenes that use it
+    numpy_import = "import numpy as np\n" if "np." in body else ""
+    header = string.Template(_SCENE_HEADER).substitute(
+        scene_class=scene_class, base=base, numpy_import=numpy_import
+    )
+    return tuple((header + body + (_SCENE_FOOTER if clean_exit else '')).split("$title"))
+
+
+# Scene code of each template, built once at import; $title is the only
+# placeholder, so the scene's own braces are written as they are
+_ENTANGLEMENT_TEMPLATE = _scene_template("QuantumEntanglementAnimation", '''\
         self.play(Write(title_text), run_time=1)
         
         # Create two entangled particles
@@ -62,9 +84,10 @@ class QuantumEntanglementAnimation(Scene):
         self.play(
             GrowFromCenter(particle_a),
             GrowFromCenter(particle_b),
+            Write(label_a),
+            Write(label_b),
             run_time=1
         )
-        self.play(Write(label_a), Write(label_b), run_time=0.5)
         
         # Show entanglement connection
         entangle_line = DashedLine(
@@ -90,15 +113,17 @@ class QuantumEntanglementAnimation(Scene):
             color=WHITE, stroke_width=4, buff=0
         )
         
-        self.play(GrowArrow(spin_a), GrowArrow(spin_b), run_time=0.5)
-        
-        # Add state labels
+        # Add state labels, appearing with the spins
         state_a = Text("Up", font_size=14, color=GREEN)
         state_a.next_to(particle_a, UP, buff=0.6)
         state_b = Text("Down", font_size=14, color=GREEN)
         state_b.next_to(particle_b, UP, buff=0.6)
         
-        self.play(FadeIn(state_a), FadeIn(state_b), run_time=0.5)
+        self.play(
+            GrowArrow(spin_a), GrowArrow(spin_b),
+            FadeIn(state_a), FadeIn(state_b),
+            run_time=0.5
+        )
         self.wait(0.5)
         
         # Show correlated flip - when one changes, other changes too
@@ -128,62 +153,42 @@ class QuantumEntanglementAnimation(Scene):
             color=WHITE, stroke_width=4, buff=0
         )
         
-        new_state_a = Text("Down", font_size=14, color=GREEN)
-        new_state_a.next_to(particle_a, UP, buff=0.6)
-        new_state_b = Text("Up", font_size=14, color=GREEN)
-        new_state_b.next_to(particle_b, UP, buff=0.6)
+        # The flipped labels are the same texts, swapped; copying skips
+        # laying the text out again
+        new_state_a = state_b.copy().next_to(particle_a, UP, buff=0.6)
+        new_state_b = state_a.copy().next_to(particle_b, UP, buff=0.6)
+        
+        # Highlight instant correlation as both spins flip
+        correlation_text = Text("Instant Correlation!", font_size=22, color=YELLOW)
+        correlation_text.to_edge(DOWN, buff=0.8)
         
         self.play(
             Transform(spin_a, new_spin_a),
             Transform(spin_b, new_spin_b),
             Transform(state_a, new_state_a),
             Transform(state_b, new_state_b),
+            Transform(flip_text, correlation_text),
             run_time=0.5
         )
         
-        # Highlight instant correlation
-        correlation_text = Text("Instant Correlation!", font_size=22, color=YELLOW)
-        correlation_text.to_edge(DOWN, buff=0.8)
-        self.play(Transform(flip_text, correlation_text), run_time=0.5)
+        # Pulsing effect to show connection: two pulses in a single play
+        def pulse_twice(t):
+            return there_and_back(2 * t % 1)
         
-        # Pulsing effect to show connection
-        for _ in range(2):
-            self.play(
-                particle_a.animate.scale(1.15),
-                particle_b.animate.scale(1.15),
-                run_time=0.25
-            )
-            self.play(
-                particle_a.animate.scale(1/1.15),
-                particle_b.animate.scale(1/1.15),
-                run_time=0.25
-            )
+        self.play(
+            particle_a.animate(rate_func=pulse_twice).scale(1.15),
+            particle_b.animate(rate_func=pulse_twice).scale(1.15),
+            run_time=1
+        )
         
         self.wait(0.5)
         
         # Clean exit
         if self.mobjects:
             self.play(*[FadeOut(m) for m in self.mobjects if m is not None], run_time=0.8)
-'''
+''', clean_exit=False)
 
-    @staticmethod
-    def superposition_state(title: str = "Quantum Superposition") -> str:
-        """
-        Generate animation showing quantum superposition - particle existing in multiple states.
-        """
-        # Sanitize title
-        title = title.replace('"', "'").replace('\\', '')[:50]
-        if not title:
-            title = "Quantum Superposition"
-        
-        return f'''from manim import *
-import numpy as np
-
-class SuperpositionAnimation(Scene):
-    def construct(self):
-        # Title
-        title_text = Text("{title}", font_size=32, color=BLUE)
-        title_text.to_edge(UP, buff=0.4)
+_SUPERPOSITION_TEMPLATE = _scene_template("SuperpositionAnimation", '''\
         self.play(Write(title_text), run_time=1)
         
         # Classical state - single definite position
@@ -224,17 +229,16 @@ class SuperpositionAnimation(Scene):
         state_label.next_to(cloud, DOWN, buff=0.3)
         self.play(Write(state_label))
         
-        # Oscillation animation
-        for _ in range(2):
-            for state in quantum_states:
-                self.play(
-                    state.animate.scale(1.3).set_opacity(0.9),
-                    run_time=0.15
-                )
-                self.play(
-                    state.animate.scale(1/1.3).set_opacity(state.get_fill_opacity()),
-                    run_time=0.15
-                )
+        # Oscillation animation: the states pulse in an overlapping ripple, two
+        # rounds in one play; each round animates every state once
+        self.play(Succession(*[
+            AnimationGroup(
+                *[state.animate(rate_func=there_and_back).scale(1.3).set_opacity(0.9)
+                  for state in quantum_states],
+                lag_ratio=0.1
+            )
+            for _ in range(2)
+        ]), run_time=3)
         
         # Measurement - collapse to single state
         measure_text = Text("Measurement", font_size=24, color=RED)
@@ -260,23 +264,9 @@ class SuperpositionAnimation(Scene):
         self.wait(1)
         if self.mobjects:
             self.play(*[FadeOut(m) for m in self.mobjects if m is not None], run_time=0.8)
-'''
+''', clean_exit=False)
 
-    @staticmethod
-    def wave_function_collapse(title: str = "Wave Function Collapse") -> str:
-        """
-        Generate animation showing wave function and its collapse upon measurement.
-        """
-        title = _sanitize_title(title, "Wave Function Collapse")
-        
-        return f'''from manim import *
-import numpy as np
-
-class WaveFunctionCollapseAnimation(Scene):
-    def construct(self):
-        # Title
-        title_text = Text("{title}", font_size=32, color=BLUE)
-        title_text.to_edge(UP, buff=0.4)
+_WAVE_FUNCTION_COLLAPSE_TEMPLATE = _scene_template("WaveFunctionCollapseAnimation", '''\
         self.play(Write(title_text), run_time=1)
         
         # Create wave function visualization
@@ -285,19 +275,22 @@ class WaveFunctionCollapseAnimation(Scene):
             y_range=[-1.5, 1.5, 0.5],
             x_length=8,
             y_length=3,
-            axis_config={{"color": GRAY, "stroke_width": 1}},
+            axis_config={"color": GRAY, "stroke_width": 1},
             tips=False
         )
         axes.shift(DOWN * 0.5)
         
-        # Wave function (Gaussian wave packet)
+        # Wave function (Gaussian wave packet); works on whole arrays of x, so
+        # each curve is sampled in one vectorized call instead of per point
         def wave_func(x, t=0):
             return np.exp(-(x)**2 / 2) * np.cos(4*x - t)
         
-        wave = axes.plot(lambda x: wave_func(x), color=PURPLE, stroke_width=3)
+        wave = axes.plot(wave_func, color=PURPLE, stroke_width=3, use_vectorized=True)
         
         # Probability density (square of wave function)
-        prob = axes.plot(lambda x: np.exp(-x**2), color=BLUE, fill_opacity=0.3, stroke_width=2)
+        prob = axes.plot(
+            lambda x: np.exp(-x**2), color=BLUE, fill_opacity=0.3, stroke_width=2, use_vectorized=True
+        )
         
         self.play(Create(axes))
         
@@ -313,7 +306,9 @@ class WaveFunctionCollapseAnimation(Scene):
         
         # Animate wave oscillation
         for t in [1, 2, 3]:
-            new_wave = axes.plot(lambda x, t=t: wave_func(x, t), color=PURPLE, stroke_width=3)
+            new_wave = axes.plot(
+                lambda x, t=t: wave_func(x, t), color=PURPLE, stroke_width=3, use_vectorized=True
+            )
             self.play(Transform(wave, new_wave), run_time=0.3)
         
         # Measurement
@@ -361,24 +356,9 @@ class WaveFunctionCollapseAnimation(Scene):
         self.play(Write(result_text))
         
         self.wait(1)
-        self.play(*[FadeOut(m) for m in self.mobjects if m is not None], run_time=0.8)
-'''
-
-    @staticmethod
-    def bell_inequality(title: str = "Bell's Inequality Test") -> str:
-        """
-        Generate animation explaining Bell's inequality and quantum non-locality.
-        """
-        title = _sanitize_title(title, "Bell's Inequality Test")
-        
-        return f'''from manim import *
-import numpy as np
+''')
 
-class BellInequalityAnimation(Scene):
-    def construct(self):
-        # Title
-        title_text = Text("{title}", font_size=32, color=BLUE)
-        title_text.to_edge(UP, buff=0.4)
+_BELL_INEQUALITY_TEMPLATE = _scene_template("BellInequalityAnimation", '''\
         self.play(Write(title_text), run_time=1)
         
         # Create source in center
@@ -476,24 +456,9 @@ class BellInequalityAnimation(Scene):
         self.play(Write(conclusion))
         
         self.wait(1)
-        self.play(*[FadeOut(m) for m in self.mobjects if m is not None], run_time=0.8)
-'''
+''')
 
-    @staticmethod
-    def quantum_teleportation(title: str = "Quantum Teleportation") -> str:
-        """
-        Generate animation showing the quantum teleportation protocol.
-        """
-        title = _sanitize_title(title, "Quantum Teleportation")
-        
-        return f'''from manim import *
-import numpy as np
-
-class QuantumTeleportationAnimation(Scene):
-    def construct(self):
-        # Title
-        title_text = Text("{title}", font_size=32, color=BLUE)
-        title_text.to_edge(UP, buff=0.4)
+_TELEPORTATION_TEMPLATE = _scene_template("QuantumTeleportationAnimation", '''\
         self.play(Write(title_text), run_time=1)
         
         # Three participants
@@ -613,24 +578,9 @@ class QuantumTeleportationAnimation(Scene):
         self.play(pulse.animate.scale(4).set_opacity(0), run_time=0.5)
         
         self.wait(1)
-        self.play(*[FadeOut(m) for m in self.mobjects if m is not None], run_time=0.8)
-'''
+''')
 
-    @staticmethod
-    def quantum_decoherence(title: str = "Quantum Decoherence") -> str:
-        """
-        Generate animation showing decoherence - loss of quantum coherence.
-        """
-        title = _sanitize_title(title, "Quantum Decoherence")
-        
-        return f'''from manim import *
-import numpy as np
-
-class DecoherenceAnimation(Scene):
-    def construct(self):
-        # Title
-        title_text = Text("{title}", font_size=32, color=BLUE)
-        title_text.to_edge(UP, buff=0.4)
+_DECOHERENCE_TEMPLATE = _scene_template("DecoherenceAnimation", '''\
         self.play(Write(title_text), run_time=1)
         
         # Create coherent quantum state
@@ -644,11 +594,12 @@ class DecoherenceAnimation(Scene):
         state_0.shift(LEFT * 1.5)
         state_1.shift(RIGHT * 1.5)
         
-        # Phase relationship shown by connecting wave
+        # Phase relationship shown by connecting wave, sampled in one call
         phase_wave = ParametricFunction(
-            lambda t: np.array([t, 0.3*np.sin(4*t), 0]),
+            lambda t: np.array([t, 0.3*np.sin(4*t), np.zeros_like(t)]),
             t_range=[-1.5, 1.5],
-            color=YELLOW
+            color=YELLOW,
+            use_vectorized=True
         )
         
         self.play(GrowFromCenter(state_0), GrowFromCenter(state_1))
@@ -661,35 +612,34 @@ class DecoherenceAnimation(Scene):
         label_1.next_to(state_1, DOWN, buff=0.2)
         self.play(Write(label_0), Write(label_1))
         
-        # Show coherent oscillation
-        for _ in range(2):
-            self.play(
-                state_0.animate.scale(1.2),
-                state_1.animate.scale(0.8),
-                run_time=0.3
-            )
-            self.play(
-                state_0.animate.scale(1/1.2),
-                state_1.animate.scale(1/0.8),
-                run_time=0.3
-            )
+        # Show coherent oscillation: two pulses in a single play
+        def pulse_twice(t):
+            return there_and_back(2 * t % 1)
+        
+        self.play(
+            state_0.animate(rate_func=pulse_twice).scale(1.2),
+            state_1.animate(rate_func=pulse_twice).scale(0.8),
+            run_time=1.2
+        )
         
         # Environment interaction
         env_label = Text("Environment Interaction", font_size=18, color=RED)
         env_label.to_edge(DOWN, buff=1.5)
         self.play(Write(env_label))
         
-        # Environment particles approaching
+        # Environment particles approaching; their directions on the ring are
+        # computed once and shared by both phases
+        angles = np.arange(8) * PI/4
+        ring = np.stack([np.cos(angles), np.sin(angles), np.zeros(8)], axis=1)
         env_particles = VGroup()
         for i in range(8):
-            angle = i * PI/4
             particle = Dot(color=GRAY, radius=0.08)
-            particle.move_to(3 * np.array([np.cos(angle), np.sin(angle), 0]))
+            particle.move_to(3 * ring[i])
             env_particles.add(particle)
         
         self.play(FadeIn(env_particles))
         self.play(
-            *[p.animate.move_to(0.8 * np.array([np.cos(i*PI/4), np.sin(i*PI/4), 0])) 
+            *[p.animate.move_to(0.8 * ring[i]) 
               for i, p in enumerate(env_particles)],
             run_time=1
         )
@@ -698,13 +648,15 @@ class DecoherenceAnimation(Scene):
         decohere_label = Text("Decoherence", font_size=24, color=RED)
         decohere_label.shift(UP * 2)
         
-        # Phase wave becomes random/noisy
+        # Phase wave becomes random/noisy; both ends of all 20 segments are
+        # drawn in one call
+        xs = np.linspace(-1.5, 1.5, 21)
+        ys = 0.3 * np.random.uniform(-1, 1, size=(20, 2))
         noisy_wave = VGroup()
         for i in range(20):
-            x = -1.5 + i * 0.15
             segment = Line(
-                np.array([x, 0.3*np.random.uniform(-1, 1), 0]),
-                np.array([x + 0.15, 0.3*np.random.uniform(-1, 1), 0]),
+                np.array([xs[i], ys[i, 0], 0]),
+                np.array([xs[i + 1], ys[i, 1], 0]),
                 color=GRAY,
                 stroke_opacity=0.5
             )
@@ -736,24 +688,9 @@ class DecoherenceAnimation(Scene):
         self.play(Write(or_text))
         
         self.wait(1)
-        self.play(*[FadeOut(m) for m in self.mobjects if m is not None], run_time=0.8)
-'''
+''')
 
-    @staticmethod
-    def quantum_tunneling(title: str = "Quantum Tunneling") -> str:
-        """
-        Generate animation showing quantum tunneling through a barrier.
-        """
-        title = _sanitize_title(title, "Quantum Tunneling")
-        
-        return f'''from manim import *
-import numpy as np
-
-class QuantumTunnelingAnimation(Scene):
-    def construct(self):
-        # Title
-        title_text = Text("{title}", font_size=32, color=BLUE)
-        title_text.to_edge(UP, buff=0.4)
+_TUNNELING_TEMPLATE = _scene_template("QuantumTunnelingAnimation", '''\
         self.play(Write(title_text), run_time=1)
         
         # Create potential barrier
@@ -778,11 +715,12 @@ class QuantumTunnelingAnimation(Scene):
             y_range=[-1, 1, 0.5],
             x_length=12,
             y_length=2,
-            axis_config={{"stroke_opacity": 0}},
+            axis_config={"stroke_opacity": 0},
             tips=False
         )
         axes.shift(DOWN * 1)
         
+        # Works on whole arrays of x, so the curve is sampled in one call
         def wave_packet(x, x0=-4, k=3):
             return np.exp(-(x - x0)**2) * np.cos(k * (x - x0))
         
@@ -791,7 +729,8 @@ class QuantumTunnelingAnimation(Scene):
             lambda x: wave_packet(x, -4),
             x_range=[-6, -1],
             color=BLUE,
-            stroke_width=3
+            stroke_width=3,
+            use_vectorized=True
         )
         
         # Probability cloud for particle
@@ -842,10 +781,11 @@ class QuantumTunnelingAnimation(Scene):
         
         # Visualize exponential decay inside barrier
         decay_in_barrier = axes.plot(
-            lambda x: 0.5 * np.exp(-2 * abs(x)) if abs(x) < 0.5 else 0,
+            lambda x: np.where(np.abs(x) < 0.5, 0.5 * np.exp(-2 * np.abs(x)), 0),
             x_range=[-0.5, 0.5],
             color=YELLOW,
-            stroke_width=2
+            stroke_width=2,
+            use_vectorized=True
         )
         
         self.play(Create(decay_in_barrier))
@@ -855,24 +795,9 @@ class QuantumTunnelingAnimation(Scene):
         self.play(pulse.animate.scale(3).set_opacity(0), run_time=0.5)
         
         self.wait(1)
-        self.play(*[FadeOut(m) for m in self.mobjects if m is not None], run_time=0.8)
-'''
+''')
 
-    @staticmethod
-    def quantum_interference(title: str = "Quantum Interference") -> str:
-        """
-        Generate animation showing double-slit quantum interference pattern.
-        """
-        title = _sanitize_title(title, "Quantum Interference")
-        
-        return f'''from manim import *
-import numpy as np
-
-class QuantumInterferenceAnimation(Scene):
-    def construct(self):
-        # Title
-        title_text = Text("{title}", font_size=32, color=BLUE)
-        title_text.to_edge(UP, buff=0.4)
+_INTERFERENCE_TEMPLATE = _scene_template("QuantumInterferenceAnimation", '''\
         self.play(Write(title_text), run_time=1)
         
         # Create double slit apparatus
@@ -906,54 +831,55 @@ class QuantumInterferenceAnimation(Scene):
         
         self.play(GrowFromCenter(source), Write(source_label))
         
-        # Emit particles through both slits
-        particles_detected = []
+        # Emit particles through both slits: all 15 trials play as one
+        # staggered animation, with their landing heights drawn up front
+        slit1_pos = UP * 0.75
+        slit2_pos = DOWN * 0.75
         
-        for trial in range(15):
-            particle = Dot(color=BLUE, radius=0.08)
-            particle.move_to(source)
-            
-            # Particle travels to slits
-            self.play(particle.animate.move_to(ORIGIN), run_time=0.15)
-            
-            # Split into two paths (superposition through both slits)
-            path1 = particle.copy().set_color(BLUE)
-            path2 = particle.copy().set_color(RED)
-            
-            # Positions through slits
-            slit1_pos = UP * 0.75
-            slit2_pos = DOWN * 0.75
-            
-            self.play(
-                path1.animate.move_to(slit1_pos),
-                path2.animate.move_to(slit2_pos),
-                FadeOut(particle),
-                run_time=0.1
-            )
-            
-            # Interference pattern - more likely at certain positions
-            # Calculate landing position based on interference
-            phase_diff = trial * 0.4
-            y_pos = 1.5 * np.sin(phase_diff) + np.random.uniform(-0.2, 0.2)
+        # Interference pattern - landings are more likely at certain heights
+        y_positions = 1.5 * np.sin(np.arange(15) * 0.4) + np.random.uniform(-0.2, 0.2, 15)
+        
+        particles_detected = []
+        trials = []
+        for y_pos in y_positions:
             landing = RIGHT * 4 + UP * y_pos
             
-            self.play(
-                path1.animate.move_to(landing),
-                path2.animate.move_to(landing),
-                run_time=0.15
-            )
+            # Superposition through both slits; the red path starts under the
+            # blue one, so a single particle seems to leave the source
+            path2 = Dot(color=RED, radius=0.08).move_to(source).set_opacity(0)
+            path1 = Dot(color=BLUE, radius=0.08).move_to(source).set_opacity(0)
             
-            # Combine and deposit on screen
-            detection = Dot(color=GREEN, radius=0.05)
-            detection.move_to(landing)
+            # Combined and deposited on screen
+            detection = Dot(color=GREEN, radius=0.05).move_to(landing).set_opacity(0)
             particles_detected.append(detection)
             
-            self.play(
-                FadeOut(path1),
-                FadeOut(path2),
-                FadeIn(detection),
-                run_time=0.05
-            )
+            # Every step sets the opacity: .animate targets are built from the
+            # dots' starting (hidden) state
+            trials.append(Succession(
+                AnimationGroup(
+                    path2.animate.move_to(ORIGIN).set_opacity(1),
+                    path1.animate.move_to(ORIGIN).set_opacity(1),
+                    run_time=0.15
+                ),
+                AnimationGroup(
+                    path1.animate.move_to(slit1_pos).set_opacity(1),
+                    path2.animate.move_to(slit2_pos).set_opacity(1),
+                    run_time=0.1
+                ),
+                AnimationGroup(
+                    path1.animate.move_to(landing).set_opacity(1),
+                    path2.animate.move_to(landing).set_opacity(1),
+                    run_time=0.15
+                ),
+                AnimationGroup(
+                    FadeOut(path1),
+                    FadeOut(path2),
+                    detection.animate.set_opacity(1),
+                    run_time=0.05
+                )
+            ))
+        
+        self.play(LaggedStart(*trials, lag_ratio=0.5))
         
         # Show interference pattern building up
         pattern_label = Text("Interference Pattern", font_size=20, color=GREEN)
@@ -969,24 +895,9 @@ class QuantumInterferenceAnimation(Scene):
         self.play(Write(bright), Write(dark))
         
         self.wait(1)
-        self.play(*[FadeOut(m) for m in self.mobjects if m is not None], run_time=0.8)
-'''
-
-    @staticmethod
-    def bloch_sphere(title: str = "Bloch Sphere - Qubit State") -> str:
-        """
-        Generate animation showing the Bloch sphere representation of a qubit.
-        """
-        title = _sanitize_title(title, "Bloch Sphere Qubit State")
-        
-        return f'''from manim import *
-import numpy as np
+''')
 
-class BlochSphereAnimation(ThreeDScene):
-    def construct(self):
-        # Title
-        title_text = Text("{title}", font_size=32, color=BLUE)
-        title_text.to_edge(UP, buff=0.4)
+_BLOCH_SPHERE_TEMPLATE = _scene_template("BlochSphereAnimation", '''\
         self.add_fixed_in_frame_mobjects(title_text)
         self.play(Write(title_text), run_time=1)
         
@@ -1032,23 +943,9 @@ class BlochSphereAnimation(ThreeDScene):
         
         self.stop_ambient_camera_rotation()
         self.wait(1)
-'''
+''', base="ThreeDScene", clean_exit=False)
 
-    @staticmethod
-    def epr_paradox(title: str = "EPR Paradox") -> str:
-        """
-        Generate animation explaining the Einstein-Podolsky-Rosen paradox.
-        """
-        title = _sanitize_title(title, "EPR Paradox")
-        
-        return f'''from manim import *
-import numpy as np
-
-class EPRParadoxAnimation(Scene):
-    def construct(self):
-        # Title
-        title_text = Text("{title}", font_size=32, color=BLUE)
-        title_text.to_edge(UP, buff=0.4)
+_EPR_PARADOX_TEMPLATE = _scene_template("EPRParadoxAnimation", '''\
         self.play(Write(title_text), run_time=1)
         
         # Einstein's concern about "spooky action at a distance"
@@ -1078,7 +975,7 @@ class EPRParadoxAnimation(Scene):
         
         particle_b = VGroup()
         p_b_circle = Circle(radius=0.2, color=RED, fill_opacity=0.8)
-        p_b_question = Text("?", font_size=20, color=WHITE)
+        p_b_question = p_a_question.copy()
         p_b_question.move_to(p_b_circle)
         particle_b.add(p_b_circle, p_b_question)
         particle_b.move_to(source)
@@ -1152,24 +1049,9 @@ class EPRParadoxAnimation(Scene):
         self.play(Write(resolution))
         
         self.wait(1)
-        self.play(*[FadeOut(m) for m in self.mobjects if m is not None], run_time=0.8)
-'''
+''')
 
-    @staticmethod
-    def quantum_measurement(title: str = "Quantum Measurement Problem") -> str:
-        """
-        Generate animation explaining the measurement problem in quantum mechanics.
-        """
-        title = _sanitize_title(title, "Quantum Measurement Problem")
-        
-        return f'''from manim import *
-import numpy as np
-
-class QuantumMeasurementAnimation(Scene):
-    def construct(self):
-        # Title
-        title_text = Text("{title}", font_size=32, color=BLUE)
-        title_text.to_edge(UP, buff=0.4)
+_MEASUREMENT_TEMPLATE = _scene_template("QuantumMeasurementAnimation", '''\
         self.play(Write(title_text), run_time=1)
         
         # Before measurement - superposition
@@ -1195,17 +1077,16 @@ class QuantumMeasurementAnimation(Scene):
         self.play(Write(before_label))
         self.play(FadeIn(superposition))
         
-        # Show states oscillating (quantum uncertainty)
-        for _ in range(2):
-            for state in states:
-                self.play(
-                    state.animate.scale(1.3).set_opacity(0.8),
-                    run_time=0.1
-                )
-                self.play(
-                    state.animate.scale(1/1.3).set_opacity(0.5),
-                    run_time=0.1
-                )
+        # Show states oscillating (quantum uncertainty): an overlapping ripple,
+        # two rounds in one play; each round animates every state once
+        self.play(Succession(*[
+            AnimationGroup(
+                *[state.animate(rate_func=there_and_back).scale(1.3).set_opacity(0.8)
+                  for state in states],
+                lag_ratio=0.2
+            )
+            for _ in range(2)
+        ]), run_time=2)
         
         # Measurement apparatus
         apparatus = VGroup()
@@ -1267,8 +1148,122 @@ class QuantumMeasurementAnimation(Scene):
         )
         
         self.wait(2)
-        self.play(*[FadeOut(m) for m in self.mobjects if m is not None], run_time=0.8)
-'''
+''')
+
+
+@functools.lru_cache(maxsize=256)
+def _fill(template: Tuple[str, ...], title: str) -> str:
+    """Code for a template and sanitized title; one bounded cache shared by all templates"""
+    return title.join(template)
+
+
+class QuantumAnimationTemplates:
+    """
+    Collection of quantum physics-specific Manim animation templates
+    
+    Generated code is memoized by template and sanitized title (see _fill); a
+    bot asked about the same topic again gets the code back directly.
+    """
+    
+    @staticmethod
+    def quantum_entanglement(title: str = "Quantum Entanglement", particles: int = 2) -> str:
+        """
+        Generate animation showing quantum entanglement between particles.
+        Shows correlated spins/states of entangled particles.
+        """
+        title = _sanitize_title(title, "Quantum Entanglement")
+        
+        return _fill(_ENTANGLEMENT_TEMPLATE, title)
+
+    @staticmethod
+    def superposition_state(title: str = "Quantum Superposition") -> str:
+        """
+        Generate animation showing quantum superposition - particle existing in multiple states.
+        """
+        title = _sanitize_title(title, "Quantum Superposition")
+        
+        return _fill(_SUPERPOSITION_TEMPLATE, title)
+
+    @staticmethod
+    def wave_function_collapse(title: str = "Wave Function Collapse") -> str:
+        """
+        Generate animation showing wave function and its collapse upon measurement.
+        """
+        title = _sanitize_title(title, "Wave Function Collapse")
+        
+        return _fill(_WAVE_FUNCTION_COLLAPSE_TEMPLATE, title)
+
+    @staticmethod
+    def bell_inequality(title: str = "Bell's Inequality Test") -> str:
+        """
+        Generate animation explaining Bell's inequality and quantum non-locality.
+        """
+        title = _sanitize_title(title, "Bell's Inequality Test")
+        
+        return _fill(_BELL_INEQUALITY_TEMPLATE, title)
+
+    @staticmethod
+    def quantum_teleportation(title: str = "Quantum Teleportation") -> str:
+        """
+        Generate animation showing the quantum teleportation protocol.
+        """
+        title = _sanitize_title(title, "Quantum Teleportation")
+        
+        return _fill(_TELEPORTATION_TEMPLATE, title)
+
+    @staticmethod
+    def quantum_decoherence(title: str = "Quantum Decoherence") -> str:
+        """
+        Generate animation showing decoherence - loss of quantum coherence.
+        """
+        title = _sanitize_title(title, "Quantum Decoherence")
+        
+        return _fill(_DECOHERENCE_TEMPLATE, title)
+
+    @staticmethod
+    def quantum_tunneling(title: str = "Quantum Tunneling") -> str:
+        """
+        Generate animation showing quantum tunneling through a barrier.
+        """
+        title = _sanitize_title(title, "Quantum Tunneling")
+        
+        return _fill(_TUNNELING_TEMPLATE, title)
+
+    @staticmethod
+    def quantum_interference(title: str = "Quantum Interference") -> str:
+        """
+        Generate animation showing double-slit quantum interference pattern.
+        """
+        title = _sanitize_title(title, "Quantum Interference")
+        
+        return _fill(_INTERFERENCE_TEMPLATE, title)
+
+    @staticmethod
+    def bloch_sphere(title: str = "Bloch Sphere - Qubit State") -> str:
+        """
+        Generate animation showing the Bloch sphere representation of a qubit.
+        """
+        title = _sanitize_title(title, "Bloch Sphere Qubit State")
+        
+        return _fill(_BLOCH_SPHERE_TEMPLATE, title)
+
+    @staticmethod
+    def epr_paradox(title: str = "EPR Paradox") -> str:
+        """
+        Generate animation explaining the Einstein-Podolsky-Rosen paradox.
+        """
+        title = _sanitize_title(title, "EPR Paradox")
+        
+        return _fill(_EPR_PARADOX_TEMPLATE, title)
+
+    @staticmethod
+    def quantum_measurement(title: str = "Quantum Measurement Problem") -> str:
+        """
+        Generate animation explaining the measurement problem in quantum mechanics.
+        """
+        title = _sanitize_title(title, "Quantum Measurement Problem")
+        
+        return _fill(_MEASUREMENT_TEMPLATE, title)
 
 
 # Export quantum templates
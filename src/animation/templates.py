@@ -6,8 +6,7 @@ Includes specialized quantum physics and entanglement animations
 """
 from typing import List, Dict, Any
 
-# Import quantum templates
-from src.animation.quantum_templates import QuantumAnimationTemplates, quantum_templates
+from src.animation.quantum_templates import quantum_templates
 
 
 class AnimationTemplates:
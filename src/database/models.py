@@ -9,12 +9,18 @@ from sqlalchemy.orm import sessionmaker, relationship
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 import enum
+import orjson
 
 from src.config import config
 
 Base = declarative_base()
 
 
+def _json_dumps(obj) -> str:
+    """Serialize JSON columns with orjson"""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 class ProcessingStatus(enum.Enum):
     """Status of paper processing"""
     PENDING = "pending"
@@ -171,6 +177,9 @@ class DatabaseManager:
             pool_recycle=300,    # Recycle connections every 5 minutes
             pool_size=5,         # Small pool for serverless
             max_overflow=10,     # Allow some overflow
+            insertmanyvalues_page_size=1000,  # Batch bulk INSERTs into few statements
+            json_serializer=_json_dumps,    # orjson for large AgentLog payloads
+            json_deserializer=orjson.loads,
             connect_args={
                 "connect_timeout": 10,
                 "keepalives": 1,
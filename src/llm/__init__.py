@@ -1,6 +1,6 @@
 """
 LLM package initialization
 """
-from src.llm.openrouter_client import OpenRouterClient, openrouter_client, LLMResponse
+from src.llm.openrouter_client import OpenRouterClient, openrouter_client, LLMResponse, FatalLLMError
 
-__all__ = ["OpenRouterClient", "openrouter_client", "LLMResponse"]
+__all__ = ["OpenRouterClient", "openrouter_client", "LLMResponse", "FatalLLMError"]
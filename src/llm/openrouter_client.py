@@ -2,11 +2,13 @@
 OpenRouter API Client for Xe-Bot
 Handles all LLM interactions via OpenRouter
 """
+import re
+import asyncio
 import httpx
 import json
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 from rich.console import Console
 
 from src.config import config
@@ -14,6 +16,28 @@ from src.config import config
 console = Console()
 
 
+class FatalLLMError(Exception):
+    """
+    The provider can't serve requests right now (bad key, no credits, outage)
+    
+    Other in-flight requests will fail the same way, so callers should stop
+    rather than keep spending on them.
+    """
+    
+    def __init__(self, status_code: int, message: str):
+        super().__init__(f"OpenRouter unavailable ({status_code}): {message}")
+        self.status_code = status_code
+
+
+# Auth/billing failures won't fix themselves between attempts
+_FATAL_STATUS_CODES = {401, 402, 403}
+
+
+def _should_retry(error: BaseException) -> bool:
+    """Retry transient errors, including 5xx, but not auth/billing failures"""
+    return not isinstance(error, FatalLLMError) or error.status_code >= 500
+
+
 @dataclass
 class LLMResponse:
     """Structured LLM response"""
@@ -40,8 +64,48 @@ class OpenRouterClient:
             "HTTP-Referer": "https://xe-bot.local",
             "X-Title": "Xe-Bot Research Animation Generator"
         }
+        
+        # Shared keep-alive HTTP/2 sessions, created lazily on first request.
+        # Pooled connections belong to the loop that opened them, so there is
+        # one session per event loop
+        self._sessions: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+    
+    def _get_session(self) -> httpx.AsyncClient:
+        """Return the running loop's shared HTTP session, creating it if needed"""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.is_closed:
+            # Forget sessions of loops that have since closed; nothing can run their close anymore
+            for stale in [other for other in self._sessions if other.is_closed()]:
+                del self._sessions[stale]
+            session = self._sessions[loop] = httpx.AsyncClient(
+                http2=True,
+                timeout=120.0,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+            )
+        return session
+    
+    async def aclose(self):
+        """Close every shared HTTP session, each on the loop that owns it"""
+        sessions, self._sessions = self._sessions, {}
+        current = asyncio.get_running_loop()
+        for loop, session in sessions.items():
+            if session.is_closed or loop.is_closed():
+                continue
+            if loop is current:
+                await session.aclose()
+            elif loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.aclose(), loop))
+            else:
+                # A loop can't be run from inside another; keep it for that loop's own aclose()
+                self._sessions[loop] = session
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception(_should_retry),
+        reraise=True
+    )
     async def chat_completion(
         self,
         messages: List[Dict[str, str]],
@@ -62,6 +126,9 @@ class OpenRouterClient:
         
         Returns:
             LLMResponse with content and metadata
+        
+        Raises:
+            FatalLLMError: Provider rejected the key/credits, or kept failing with 5xx
         """
         model = model or self.default_model
         
@@ -75,20 +142,22 @@ class OpenRouterClient:
         if json_mode:
             payload["response_format"] = {"type": "json_object"}
         
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            try:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=self.headers,
-                    json=payload
-                )
-                response.raise_for_status()
-                data = response.json()
-            except httpx.HTTPStatusError as e:
-                console.print(f"[red]OpenRouter API Error: {e.response.status_code}[/red]")
-                console.print(f"[red]Response: {e.response.text}[/red]")
-                console.print(f"[yellow]API Key (first 20 chars): {self.api_key[:20]}...[/yellow]")
-                raise
+        try:
+            response = await self._get_session().post(
+                f"{self.base_url}/chat/completions",
+                headers=self.headers,
+                json=payload
+            )
+            response.raise_for_status()
+            data = response.json()
+        except httpx.HTTPStatusError as e:
+            console.print(f"[red]OpenRouter API Error: {e.response.status_code}[/red]")
+            console.print(f"[red]Response: {e.response.text}[/red]")
+            console.print(f"[yellow]API Key (first 20 chars): {self.api_key[:20]}...[/yellow]")
+            status_code = e.response.status_code
+            if status_code in _FATAL_STATUS_CODES or status_code >= 500:
+                raise FatalLLMError(status_code, e.response.text[:200]) from e
+            raise
         
         return LLMResponse(
             content=data["choices"][0]["message"]["content"],
@@ -780,7 +849,7 @@ TEXT PLACEMENT RULES:
 Return ONLY Python code. No markdown, no explanations.'''
         
         # Extract first line of viz_hint for the required visual type
-        viz_type = viz_hint.split('\n')[0].split(':')[0].strip() if '\n' in viz_hint else viz_hint.split(':')[0].strip()
+        viz_type = viz_hint.partition('\n')[0].partition(':')[0].strip()
         
         # Get conceptual understanding from segment (new fields from enhanced segmentation)
         concept_summary = segment.get('concept_summary', segment.get('content', '')[:200])
@@ -953,8 +1022,6 @@ Generate the Manim code:'''
 
     def _clean_code_response(self, code: str) -> str:
         """Clean LLM response to extract valid Python code"""
-        import re
-        
         # Remove markdown code blocks
         code = code.strip()
         